@@ -7,6 +7,7 @@ from app.agents.fact_checker import FactCheckerAgent
 from app.agents.report_generator import ReportGeneratorAgent
 from app.agents.user_proxy import UserProxyAgent
 from app.agents.orchestrator import AgentOrchestrator
+from app.agents.memory import WorkflowMemory
 
 __all__ = [
     "BaseAgent",
@@ -15,5 +16,6 @@ __all__ = [
     "FactCheckerAgent",
     "ReportGeneratorAgent",
     "UserProxyAgent",
-    "AgentOrchestrator"
+    "AgentOrchestrator",
+    "WorkflowMemory"
 ]
@@ -6,17 +6,21 @@ Phase 1: reads sources / raw findings from MongoDB by session_id
 instead of receiving them in the context dict.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import json
 import re
 
 from app.agents.base_agent import BaseAgent, AgentStatus
+from app.agents.memory import WorkflowMemory
 from app.config import settings
 from app.utils.logging import logger
 from app.database.repositories import SourceRepository, FindingRepository
 
 
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+
+
 class AnalystAgent(BaseAgent):
     """
     Analyst Agent - Information synthesis and analysis specialist.
@@ -29,6 +33,8 @@ class AnalystAgent(BaseAgent):
     - Organize findings hierarchically
     """
     
+    required_context = frozenset({"query", "session_id", "memory"})
+    
     def __init__(self):
         system_prompt = """You are an expert research analyst who synthesizes information from multiple sources into actionable findings.
 
@@ -71,6 +77,7 @@ Your analysis MUST be substantive and data-driven. Abstract statements without e
         """
         query = context.get("query", "")
         session_id = context.get("session_id", "")
+        memory: Optional[WorkflowMemory] = context.get("memory")
         
         logger.info(f"Analyst starting analysis for: {query} (session={session_id})")
         
@@ -83,8 +90,14 @@ Your analysis MUST be substantive and data-driven. Abstract statements without e
             raw_findings: List[Dict[str, Any]] = []
 
             if session_id:
-                source_docs = await SourceRepository.get_by_research(session_id)
-                sources = [self._source_doc_to_dict(s) for s in source_docs]
+                if memory is not None and memory.sources is not None:
+                    sources = memory.sources
+                else:
+                    source_docs = await SourceRepository.get_by_research(session_id)
+                    sources = [self._source_doc_to_dict(s) for s in source_docs]
+                    # Later agents reuse the converted sources
+                    if memory is not None:
+                        memory.sources = sources
 
                 finding_docs = await FindingRepository.get_by_research(session_id)
                 raw_findings = [self._finding_doc_to_dict(f) for f in finding_docs]
@@ -218,7 +231,7 @@ Respond in JSON format:
             response = await self.think(prompt)
             
             # Parse JSON response
-            json_match = re.search(r'\{[\s\S]*\}', response)
+            json_match = _JSON_OBJECT_RE.search(response)
             if json_match:
                 data = json.loads(json_match.group())
                 findings = data.get("consolidated_findings", [])
@@ -289,7 +302,7 @@ Respond in JSON:
         
         try:
             response = await self.think(prompt)
-            json_match = re.search(r'\{[\s\S]*\}', response)
+            json_match = _JSON_OBJECT_RE.search(response)
             if json_match:
                 data = json.loads(json_match.group())
                 return data.get("consolidated_findings", [])
@@ -340,7 +353,7 @@ Respond in JSON:
         
         try:
             response = await self.think(prompt)
-            json_match = re.search(r'\{[\s\S]*\}', response)
+            json_match = _JSON_OBJECT_RE.search(response)
             if json_match:
                 data = json.loads(json_match.group())
                 return data.get("patterns", [])
@@ -392,7 +405,7 @@ If no significant contradictions exist, return empty array."""
         
         try:
             response = await self.think(prompt)
-            json_match = re.search(r'\{[\s\S]*\}', response)
+            json_match = _JSON_OBJECT_RE.search(response)
             if json_match:
                 data = json.loads(json_match.group())
                 return data.get("contradictions", [])
@@ -7,7 +7,7 @@ wrapped with Sentry spans for tracing and error capture.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, FrozenSet
 from datetime import datetime
 from enum import Enum
 
@@ -27,11 +27,23 @@ class AgentStatus(str, Enum):
     FAILED = "failed"
 
 
+# Statuses that close an agent run (stamp ``end_time``)
+TERMINAL_STATUSES = frozenset({AgentStatus.COMPLETED, AgentStatus.FAILED})
+
+
 class BaseAgent(ABC):
     """
     Base class for all research agents.
     Provides common functionality and interface.
     """
+
+    # Context keys the agent reads.  The orchestrator passes each agent
+    # only these keys; ``None`` means the agent receives the full context.
+    required_context: Optional[FrozenSet[str]] = None
+
+    # Whether the same inputs reliably produce a reusable result, so the
+    # orchestrator may serve the output from the Redis agent cache.
+    cacheable: bool = False
     
     def __init__(
         self,
@@ -72,8 +84,9 @@ class BaseAgent(ABC):
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
         
-        # Callback for progress updates
+        # Callback for progress updates (``agent_name`` key computed once)
         self._progress_callback: Optional[Callable] = None
+        self._callback_name = name.lower().replace(" ", "_")
     
     def set_progress_callback(self, callback: Callable):
         """Set callback for progress updates."""
@@ -87,7 +100,7 @@ class BaseAgent(ABC):
         
         if self._progress_callback:
             await self._progress_callback(
-                agent_name=self.name.lower().replace(" ", "_"),
+                agent_name=self._callback_name,
                 status=self.status.value,
                 progress=progress,
                 output=message
@@ -101,12 +114,12 @@ class BaseAgent(ABC):
         
         if status == AgentStatus.IN_PROGRESS and self.start_time is None:
             self.start_time = datetime.utcnow()
-        elif status in [AgentStatus.COMPLETED, AgentStatus.FAILED]:
+        elif status in TERMINAL_STATUSES:
             self.end_time = datetime.utcnow()
         
         if self._progress_callback:
             await self._progress_callback(
-                agent_name=self.name.lower().replace(" ", "_"),
+                agent_name=self._callback_name,
                 status=status.value,
                 progress=self.progress,
                 output=self.output,
@@ -126,11 +139,18 @@ class BaseAgent(ABC):
         """
         pass
     
-    async def think(self, prompt: str, context: Optional[str] = None) -> str:
+    async def think(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        cached_prefix: Optional[str] = None
+    ) -> str:
         """
         Use LLM for reasoning/thinking.
         
         Phase 3: wrapped with Sentry span for tracing.
+        ``cached_prefix`` carries context shared across several calls
+        (see ``LLMTools.generate``).
         """
         full_prompt = prompt
         if context:
@@ -139,14 +159,15 @@ class BaseAgent(ABC):
         with sentry_sdk.start_span(op="llm.generate", description=f"{self.name} think") as span:
             span.set_data("agent", self.name)
             span.set_data("model", self.model)
-            span.set_data("prompt_length", len(full_prompt))
+            span.set_data("prompt_length", len(full_prompt) + len(cached_prefix or ""))
             try:
                 response = await self.llm.generate(
                     prompt=full_prompt,
                     model=self.model,
                     system_prompt=self.system_prompt,
                     temperature=self.temperature,
-                    max_tokens=self.max_tokens
+                    max_tokens=self.max_tokens,
+                    cached_prefix=cached_prefix
                 )
                 span.set_data("response_length", len(response))
                 return response
@@ -176,5 +197,13 @@ class BaseAgent(ABC):
         self.start_time = None
         self.end_time = None
     
+    def release(self):
+        """
+        Clear all session-bound state so the instance can be reused by
+        another research session (see the orchestrator's agent pool).
+        """
+        self.reset()
+        self._progress_callback = None
+    
     def __repr__(self):
         return f"<{self.__class__.__name__}(name={self.name}, status={self.status.value})>"
@@ -14,6 +14,11 @@ from app.utils.logging import logger
 from app.tools.document_tools import DocumentTools
 
 
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+_JSON_ARRAY_RE = re.compile(r'\[[\s\S]*\]')
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+
+
 class DocumentAnalyzer(BaseAgent):
     """
     Agent specialized in document analysis.
@@ -408,7 +413,7 @@ Provide your response directly without JSON formatting."""
             pass
         
         # Try to find array in response
-        match = re.search(r'\[[\s\S]*\]', response)
+        match = _JSON_ARRAY_RE.search(response)
         if match:
             try:
                 return json.loads(match.group())
@@ -416,7 +421,7 @@ Provide your response directly without JSON formatting."""
                 pass
         
         # Last resort: try to extract items
-        items = re.findall(r'"([^"]+)"', response)
+        items = _QUOTED_RE.findall(response)
         return items if items else []
     
     def _parse_json_object(self, response: str) -> Optional[Dict[str, Any]]:
@@ -427,7 +432,7 @@ Provide your response directly without JSON formatting."""
             pass
         
         # Try to find object in response
-        match = re.search(r'\{[\s\S]*\}', response)
+        match = _JSON_OBJECT_RE.search(response)
         if match:
             try:
                 return json.loads(match.group())
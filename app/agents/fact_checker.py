@@ -6,16 +6,21 @@ Phase 1: reads sources and organized findings from MongoDB by session_id
 instead of receiving them in the context dict.
 """
 
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from app.agents.base_agent import BaseAgent, AgentStatus
+from app.agents.memory import WorkflowMemory
 from app.tools.validation_tools import ValidationTools
 from app.config import settings
 from app.utils.logging import logger
 from app.database.repositories import SourceRepository, ResearchRepository
 
 
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?%?')
+
+
 class FactCheckerAgent(BaseAgent):
     """
     Fact-Checker Agent - Validation and verification specialist.
@@ -28,6 +33,8 @@ class FactCheckerAgent(BaseAgent):
     - Score confidence levels for findings
     """
     
+    required_context = frozenset({"query", "session_id", "memory"})
+    
     def __init__(self):
         system_prompt = """You are a rigorous fact-checker who verifies all claims with precision.
 
@@ -70,6 +77,7 @@ Your verification must be thorough and honest."""
         """
         query = context.get("query", "")
         session_id = context.get("session_id", "")
+        memory: Optional[WorkflowMemory] = context.get("memory")
 
         # ── Phase 1: query MongoDB ────────────────────────────────
         sources: List[Dict[str, Any]] = []
@@ -77,13 +85,22 @@ Your verification must be thorough and honest."""
         insights: List[str] = []
 
         if session_id:
-            # Sources from Source collection
-            source_docs = await SourceRepository.get_by_research(session_id)
-            sources = [self._source_doc_to_dict(s) for s in source_docs]
+            # Sources from Source collection (or shared memory)
+            if memory is not None and memory.sources is not None:
+                sources = memory.sources
+            else:
+                source_docs = await SourceRepository.get_by_research(session_id)
+                sources = [self._source_doc_to_dict(s) for s in source_docs]
+                if memory is not None:
+                    memory.sources = sources
 
-            # Organized findings from pipeline_data
-            findings = await ResearchRepository.get_pipeline_data(session_id, "organized_findings") or []
-            insights = await ResearchRepository.get_pipeline_data(session_id, "key_insights") or []
+            # Organized findings from pipeline_data (or shared memory)
+            if memory is not None and memory.organized_findings is not None:
+                findings = memory.organized_findings
+                insights = memory.key_insights or []
+            else:
+                findings = await ResearchRepository.get_pipeline_data(session_id, "organized_findings") or []
+                insights = await ResearchRepository.get_pipeline_data(session_id, "key_insights") or []
         else:
             # Backward compat / tests
             sources = context.get("sources", [])
@@ -254,8 +271,7 @@ Your verification must be thorough and honest."""
             finding_type = finding.get("finding_type", "")
             
             # Check if this finding contains statistics
-            import re
-            has_numbers = bool(re.search(r'\d+(?:\.\d+)?%?', content))
+            has_numbers = bool(_NUMBER_RE.search(content))
             is_statistic = finding_type == "statistic"
             
             if has_numbers or is_statistic:
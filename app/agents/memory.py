@@ -0,0 +1,29 @@
+"""
+Workflow Memory
+Shared in-process state for a single research workflow.
+
+Phase 1 keeps MongoDB as the system of record: agent outputs are
+persisted there and downstream agents load them by session_id.  Within
+one workflow run the orchestrator already holds those outputs, so the
+``WorkflowMemory`` travels in the context by reference and lets later
+agents reuse them instead of re-querying the same session data.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+
+
+@dataclass(slots=True)
+class WorkflowMemory:
+    """
+    Session-scoped data shared between agents by reference.
+
+    Fields left as ``None`` have not been populated yet and agents fall
+    back to MongoDB.  Only the orchestrator (and the first agent to load
+    sources from the DB) writes to it; agents treat it as read-only.
+    """
+    sources: Optional[List[Dict[str, Any]]] = None
+    organized_findings: Optional[List[Dict[str, Any]]] = None
+    key_insights: Optional[List[str]] = None
+    validated_findings: Optional[List[Dict[str, Any]]] = None
+    confidence_summary: Optional[Dict[str, Any]] = None
@@ -7,20 +7,26 @@ Phase 1 refactor: agents no longer pass raw text payloads through the
 persisted to MongoDB and subsequent agents receive only the session_id.
 """
 
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, List, Awaitable, Deque
+from collections import deque
 from datetime import datetime
 from enum import Enum
+from itertools import count
+from operator import itemgetter
 import asyncio
+import time
 
 import sentry_sdk
 
-from app.agents.base_agent import AgentStatus
+from app.agents.base_agent import AgentStatus, BaseAgent
+from app.agents.memory import WorkflowMemory
 from app.agents.researcher import ResearcherAgent
 from app.agents.analyst import AnalystAgent
 from app.agents.fact_checker import FactCheckerAgent
 from app.agents.report_generator import ReportGeneratorAgent
 from app.agents.user_proxy import UserProxyAgent
 from app.config import settings
+from app.services.redis_cache import get_redis
 from app.utils.logging import logger
 from app.database.repositories import (
     ResearchRepository, SourceRepository, FindingRepository
@@ -40,6 +46,159 @@ class WorkflowPhase(str, Enum):
     FAILED = "failed"
 
 
+# =================================================================
+# Agent pool — agent construction (prompts, tool clients) is paid once
+# per process instead of once per research session.  Agents carry
+# per-run status/progress, so each orchestrator checks them out
+# exclusively and returns them when its workflow ends.
+# =================================================================
+# Keys are listed in workflow order
+_AGENT_FACTORIES: Dict[str, Callable[[], BaseAgent]] = {
+    "user_proxy": UserProxyAgent,
+    "researcher": ResearcherAgent,
+    "analyst": AnalystAgent,
+    "fact_checker": FactCheckerAgent,
+    "report_generator": ReportGeneratorAgent,
+}
+_AGENT_POOL: Dict[str, List[BaseAgent]] = {key: [] for key in _AGENT_FACTORIES}
+_AGENT_POOL_MAX_IDLE = 4  # idle instances kept per agent type
+
+_get_progress = itemgetter("progress")
+
+
+def _slice_context(agent: BaseAgent, context: Dict[str, Any]) -> Dict[str, Any]:
+    """Return only the context keys the agent declares in ``required_context``."""
+    keys = agent.required_context
+    if keys is None:
+        return context
+    return {k: context[k] for k in keys if k in context}
+
+
+def _acquire_agent(agent_key: str) -> BaseAgent:
+    """Take an idle agent from the pool, or build a new one."""
+    idle = _AGENT_POOL[agent_key]
+    return idle.pop() if idle else _AGENT_FACTORIES[agent_key]()
+
+
+def _release_agent(agent_key: str, agent: BaseAgent):
+    """Clear an agent's session state and return it to the pool."""
+    agent.release()
+    idle = _AGENT_POOL[agent_key]
+    if len(idle) < _AGENT_POOL_MAX_IDLE and agent not in idle:
+        idle.append(agent)
+
+
+class _ProgressCoalescer:
+    """
+    Debounces high-frequency progress updates and delivers them to the
+    real callback (WebSocket + Redis + MongoDB fan-out) from a single
+    background sender, so a slow client never stalls agent execution.
+
+    Only the latest update per agent is kept and flushed after a short
+    delay.  Terminal statuses ("completed"/"failed") bypass the debounce
+    so clients never miss the end of an agent run.  Flushed updates wait
+    in a bounded outbox; when it is full the newest update replaces an
+    older one for the same (agent, status) — latest value wins.
+
+    Every update that leaves the debounce stage gets a monotonically
+    increasing ``seq``, so clients can detect updates dropped under
+    backpressure and ask for a replay.
+    """
+
+    __slots__ = ("_callback", "_pending", "_handle", "_outbox", "_sender", "_seq", "dropped")
+
+    FLUSH_DELAY = 0.05  # seconds
+    MAX_QUEUED = 64
+    IMMEDIATE_STATUSES = frozenset({"completed", "failed"})
+
+    def __init__(self, callback: Callable):
+        self._callback = callback
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._outbox: Deque[Dict[str, Any]] = deque()
+        self._sender: Optional[asyncio.Task] = None
+        self._seq = count(1)
+        # Updates discarded under backpressure (signals a slow consumer)
+        self.dropped = 0
+
+    async def __call__(
+        self,
+        agent_name: str,
+        status: str,
+        progress: int,
+        output: Optional[str] = None,
+        error: Optional[str] = None
+    ):
+        update = {
+            "agent_name": agent_name,
+            "status": status,
+            "progress": progress,
+            "output": output,
+            "error": error
+        }
+
+        if status in self.IMMEDIATE_STATUSES:
+            # Superseded by the terminal update; queue everyone else first
+            # so ordering across agents is preserved.
+            self._pending.pop(agent_name, None)
+            self._move_pending()
+            self._enqueue(update)
+            self._start_sender()
+            return
+
+        self._pending[agent_name] = update
+        if self._handle is None:
+            loop = asyncio.get_running_loop()
+            self._handle = loop.call_later(self.FLUSH_DELAY, self._on_timer)
+
+    def _on_timer(self):
+        self._handle = None
+        self._move_pending()
+        self._start_sender()
+
+    def _move_pending(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, {}
+        for update in pending.values():
+            self._enqueue(update)
+
+    def _enqueue(self, update: Dict[str, Any]):
+        update["seq"] = next(self._seq)
+        if len(self._outbox) >= self.MAX_QUEUED:
+            self.dropped += 1
+            if self.dropped == 1:
+                logger.warning("Progress consumer is falling behind; coalescing queued updates")
+            key = (update["agent_name"], update["status"])
+            for queued in self._outbox:
+                if (queued["agent_name"], queued["status"]) == key:
+                    self._outbox.remove(queued)
+                    break
+            else:
+                self._outbox.popleft()
+        self._outbox.append(update)
+
+    def _start_sender(self):
+        if self._outbox and (self._sender is None or self._sender.done()):
+            self._sender = asyncio.ensure_future(self._drain())
+
+    async def _drain(self):
+        while self._outbox:
+            update = self._outbox.popleft()
+            try:
+                await self._callback(**update)
+            except Exception as e:
+                logger.warning(f"Progress callback failed for {update['agent_name']}: {e}")
+
+    async def flush(self):
+        """Deliver all pending and queued updates to the real callback."""
+        self._move_pending()
+        self._start_sender()
+        while self._sender is not None and not self._sender.done():
+            await asyncio.shield(self._sender)
+
+
 class AgentOrchestrator:
     """
     Agent Orchestrator - Coordinates multi-agent research workflow.
@@ -56,29 +215,61 @@ class AgentOrchestrator:
     - Supervised mode: Checkpoints for human approval
     - Real-time progress updates via WebSocket
     """
+
+    # One orchestrator lives per research session; slots keep the
+    # per-instance footprint small and attribute access cheap.
+    __slots__ = (
+        "session_id", "current_phase", "started_at", "completed_at",
+        "user_proxy", "researcher", "analyst", "fact_checker",
+        "report_generator", "_progress_callback", "is_running",
+        "is_cancelled", "results", "errors", "_final_response",
+        "_agents_released", "_workflow_task",
+        "_agents", "_started_at_iso", "_t0", "_duration_seconds",
+        "_agent_states",
+    )
     
     def __init__(self):
         """Initialize the orchestrator and all agents."""
         self.session_id: Optional[str] = None
-        self.current_phase = WorkflowPhase.INITIALIZATION
+        # Stored as the plain ``WorkflowPhase`` value for status payloads
+        self.current_phase: str = WorkflowPhase.INITIALIZATION.value
         self.started_at: Optional[datetime] = None
         self.completed_at: Optional[datetime] = None
+        self._started_at_iso: Optional[str] = None
+        # Monotonic clock for duration math (immune to wall-clock changes)
+        self._t0: Optional[float] = None
+        self._duration_seconds: Optional[float] = None
         
-        # Initialize all agents
-        self.user_proxy = UserProxyAgent()
-        self.researcher = ResearcherAgent()
-        self.analyst = AnalystAgent()
-        self.fact_checker = FactCheckerAgent()
-        self.report_generator = ReportGeneratorAgent()
+        # Check out all agents from the process-wide pool as (key, agent)
+        # pairs in workflow order; every all-agent operation iterates these
+        self._agents = tuple((key, _acquire_agent(key)) for key in _AGENT_FACTORIES)
+        (
+            self.user_proxy,
+            self.researcher,
+            self.analyst,
+            self.fact_checker,
+            self.report_generator,
+        ) = (agent for _, agent in self._agents)
+        self._agents_released = False
         
         # Callback for progress updates
         self._progress_callback: Optional[Callable] = None
         
+        # Agent states kept current from the agents' own progress
+        # updates, so status polling does not rebuild them each call
+        self._agent_states: Dict[str, Dict[str, Any]] = {}
+        for key, agent in self._agents:
+            self._agent_states[key] = agent.get_state()
+            agent.set_progress_callback(self._track_agent(key, agent))
+        
         # Execution state
         self.is_running = False
         self.is_cancelled = False
         self.results: Dict[str, Any] = {}
         self.errors: List[str] = []
+        # Task running ``execute``; ``cancel`` interrupts it mid-agent
+        self._workflow_task: Optional[asyncio.Task] = None
+        self._final_response: Optional[Dict[str, Any]] = None
     
     def set_progress_callback(self, callback: Callable):
         """
@@ -90,17 +281,48 @@ class AgentOrchestrator:
             status: str,
             progress: int,
             output: Optional[str] = None,
-            error: Optional[str] = None
+            error: Optional[str] = None,
+            seq: Optional[int] = None
         )
+        
+        Updates are coalesced per agent (see ``_ProgressCoalescer``) so
+        fine-grained agent progress does not flood the WebSocket.
         """
-        self._progress_callback = callback
+        # Agents report through ``_track_agent``, which forwards here
+        self._progress_callback = _ProgressCoalescer(callback)
+    
+    def _track_agent(self, agent_key: str, agent: BaseAgent) -> Callable:
+        """Build an agent progress hook that updates ``_agent_states``."""
+        state = self._agent_states[agent_key]
+        
+        async def on_progress(
+            agent_name: str,
+            status: str,
+            progress: int,
+            output: Optional[str] = None,
+            error: Optional[str] = None
+        ):
+            if status != state["status"]:
+                # Only status changes move the start/end timestamps
+                state["start_time"] = agent.start_time.isoformat() if agent.start_time else None
+                state["end_time"] = agent.end_time.isoformat() if agent.end_time else None
+                state["status"] = status
+            state["progress"] = progress
+            if output is not None:
+                state["output"] = output
+            if error is not None:
+                state["error"] = error
+            
+            if self._progress_callback:
+                await self._progress_callback(
+                    agent_name=agent_name,
+                    status=status,
+                    progress=progress,
+                    output=output,
+                    error=error
+                )
         
-        # Set callback on all agents
-        self.user_proxy.set_progress_callback(callback)
-        self.researcher.set_progress_callback(callback)
-        self.analyst.set_progress_callback(callback)
-        self.fact_checker.set_progress_callback(callback)
-        self.report_generator.set_progress_callback(callback)
+        return on_progress
     
     async def _notify_progress(
         self,
@@ -149,10 +371,15 @@ class AgentOrchestrator:
         """
         self.session_id = session_id
         self.started_at = datetime.utcnow()
+        self._started_at_iso = self.started_at.isoformat()
+        self._t0 = time.monotonic()
+        self._duration_seconds = None
         self.is_running = True
         self.is_cancelled = False
         self.results = {}
         self.errors = []
+        self._workflow_task = asyncio.current_task()
+        self._final_response = None
         
         logger.info(f"Starting research workflow for session {session_id}: {query}")
         
@@ -168,7 +395,7 @@ class AgentOrchestrator:
         
         try:
             # Phase 1: Query Processing (User Proxy)
-            self.current_phase = WorkflowPhase.QUERY_PROCESSING
+            self.current_phase = WorkflowPhase.QUERY_PROCESSING.value
             await self._notify_progress(
                 "orchestrator", "in_progress", 5,
                 "Phase 1: Processing research query..."
@@ -196,14 +423,14 @@ class AgentOrchestrator:
             self.results["user_proxy"] = user_proxy_result
             
             # Phase 2: Research (Researcher)
-            self.current_phase = WorkflowPhase.RESEARCH
+            self.current_phase = WorkflowPhase.RESEARCH.value
             await self._notify_progress(
                 "orchestrator", "in_progress", 20,
                 "Phase 2: Gathering information..."
             )
             
-            researcher_result = await self._execute_agent(
-                self.researcher, final_context, "researcher"
+            researcher_result = await self._run_research(
+                session_id, final_context, query, max_sources
             )
             
             if researcher_result.get("status") == "failed":
@@ -212,39 +439,12 @@ class AgentOrchestrator:
             self.results["researcher"] = researcher_result
 
             # ── Phase 1 state management ──────────────────────────────
-            # Persist sources + raw findings to MongoDB; do NOT put them
-            # into final_context so downstream agents query the DB.
-            await self._persist_researcher_output(session_id, researcher_result)
-            # Verify sources actually landed in MongoDB
-            source_count = await SourceRepository.count_by_research(session_id)
-            if source_count == 0:
-                logger.warning("0 sources persisted after researcher run — retrying with broadened query")
-                sentry_sdk.capture_message(
-                    f"0 sources persisted for session {session_id}, retrying with broader query",
-                    level="warning",
-                )
-                await self._notify_progress(
-                    "researcher", "in_progress", 30,
-                    "No sources found — retrying with a broader search…"
-                )
-                # Build a broader retry context
-                retry_context = {**final_context}
-                retry_context["query"] = f"{query} overview research analysis"
-                retry_context["max_sources"] = max(max_sources, 100)
-                retry_result = await self._execute_agent(
-                    self.researcher, retry_context, "researcher"
-                )
-                if retry_result.get("status") != "failed":
-                    self.results["researcher"] = retry_result
-                    researcher_result = retry_result
-                    await self._persist_researcher_output(session_id, retry_result)
-                    source_count = await SourceRepository.count_by_research(session_id)
-                    logger.info(f"Retry persisted {source_count} sources")
-                else:
-                    logger.error("Retry also failed — continuing with 0 sources")
             # Only lightweight refs travel in context from now on
             final_context["session_id"] = session_id
             final_context["sources_count"] = researcher_result.get("sources_count", {})
+            # Shared by reference so agents can skip re-loading session data
+            memory = WorkflowMemory()
+            final_context["memory"] = memory
             # ──────────────────────────────────────────────────────────
             
             # Supervised checkpoint after research
@@ -252,7 +452,7 @@ class AgentOrchestrator:
                 await self._checkpoint("research_complete", researcher_result)
             
             # Phase 3: Analysis (Analyst)
-            self.current_phase = WorkflowPhase.ANALYSIS
+            self.current_phase = WorkflowPhase.ANALYSIS.value
             await self._notify_progress(
                 "orchestrator", "in_progress", 45,
                 "Phase 3: Analyzing findings..."
@@ -269,6 +469,8 @@ class AgentOrchestrator:
 
             # ── Phase 1 state management ──────────────────────────────
             await self._persist_analyst_output(session_id, analyst_result)
+            memory.organized_findings = analyst_result.get("organized_findings", [])
+            memory.key_insights = analyst_result.get("key_insights", [])
             # ──────────────────────────────────────────────────────────
             
             # Supervised checkpoint after analysis
@@ -276,15 +478,23 @@ class AgentOrchestrator:
                 await self._checkpoint("analysis_complete", analyst_result)
             
             # Phase 4: Fact-Checking (Fact-Checker)
-            self.current_phase = WorkflowPhase.FACT_CHECKING
+            self.current_phase = WorkflowPhase.FACT_CHECKING.value
             await self._notify_progress(
                 "orchestrator", "in_progress", 65,
                 "Phase 4: Verifying facts..."
             )
             
-            fact_checker_result = await self._execute_agent(
-                self.fact_checker, final_context, "fact_checker"
-            )
+            # The Report Generator's DB loads and title drafting don't depend
+            # on fact-checking, so overlap them with the Fact-Checker run.
+            try:
+                fact_checker_result, _ = await self._execute_parallel(
+                    self._execute_agent(self.fact_checker, final_context, "fact_checker"),
+                    self.report_generator.prepare(
+                        _slice_context(self.report_generator, final_context)
+                    ),
+                )
+            except Exception as e:
+                fact_checker_result = {"status": "failed", "error": str(e)}
             
             if fact_checker_result.get("status") == "failed":
                 # Non-critical failure - pass through unverified findings so report still has data
@@ -292,24 +502,28 @@ class AgentOrchestrator:
                 self.errors.append("Fact-checking incomplete")
                 
                 # Persist a fallback confidence_summary so report_generator can load it
+                fallback_confidence = {
+                    "overall_confidence": 0.5,
+                    "confidence_level": "medium",
+                    "verified_findings": 0,
+                    "total_findings": 0,
+                    "note": "Fact-checking failed; findings are unverified"
+                }
                 await ResearchRepository.save_pipeline_data(
-                    session_id, "confidence_summary", {
-                        "overall_confidence": 0.5,
-                        "confidence_level": "medium",
-                        "verified_findings": 0,
-                        "total_findings": 0,
-                        "note": "Fact-checking failed; findings are unverified"
-                    }
+                    session_id, "confidence_summary", fallback_confidence
                 )
+                memory.confidence_summary = fallback_confidence
             else:
                 self.results["fact_checker"] = fact_checker_result
                 
                 # ── Phase 1 state management ──────────────────────────
                 await self._persist_fact_checker_output(session_id, fact_checker_result)
+                memory.validated_findings = fact_checker_result.get("validated_findings", [])
+                memory.confidence_summary = fact_checker_result.get("confidence_summary") or {}
                 # ──────────────────────────────────────────────────────
             
             # Phase 5: Report Generation (Report Generator)
-            self.current_phase = WorkflowPhase.REPORT_GENERATION
+            self.current_phase = WorkflowPhase.REPORT_GENERATION.value
             await self._notify_progress(
                 "orchestrator", "in_progress", 85,
                 "Phase 5: Generating report..."
@@ -325,8 +539,9 @@ class AgentOrchestrator:
             self.results["report_generator"] = report_result
             
             # Complete
-            self.current_phase = WorkflowPhase.COMPLETED
+            self.current_phase = WorkflowPhase.COMPLETED.value
             self.completed_at = datetime.utcnow()
+            self._duration_seconds = time.monotonic() - self._t0
             self.is_running = False
             
             await self._notify_progress(
@@ -334,13 +549,18 @@ class AgentOrchestrator:
                 "Research completed successfully!"
             )
             
-            return self._build_final_response()
+            self._final_response = self._build_final_response()
+            return self._final_response
             
         except asyncio.CancelledError:
             logger.info(f"Research cancelled for session {session_id}")
+            if self.is_cancelled and self._workflow_task is not None:
+                # User-requested cancel is handled here; clear it so the
+                # surrounding task (e.g. the background job) keeps running.
+                self._workflow_task.uncancel()
             self.is_cancelled = True
             self.is_running = False
-            self.current_phase = WorkflowPhase.FAILED
+            self.current_phase = WorkflowPhase.FAILED.value
             return {
                 "status": "cancelled",
                 "session_id": session_id,
@@ -349,14 +569,35 @@ class AgentOrchestrator:
             
         except Exception as e:
             logger.error(f"Orchestrator error: {e}")
-            self.current_phase = WorkflowPhase.FAILED
+            self.current_phase = WorkflowPhase.FAILED.value
             self.is_running = False
             return {
                 "status": "failed",
                 "session_id": session_id,
                 "error": str(e),
-                "phase": self.current_phase.value
+                "phase": self.current_phase
             }
+
+        finally:
+            # Don't leave debounced updates behind once the workflow ends
+            if isinstance(self._progress_callback, _ProgressCoalescer):
+                await self._progress_callback.flush()
+            self.release_agents()
+    
+    def release_agents(self):
+        """
+        Return this orchestrator's agents to the shared pool.
+
+        Called when ``execute`` finishes; the orchestrator is single-use
+        per research session after that point.
+        """
+        # Releasing twice could wipe state from a session that has since
+        # checked the same instances out again.
+        if self._agents_released:
+            return
+        self._agents_released = True
+        for agent_key, agent in self._agents:
+            _release_agent(agent_key, agent)
     
     async def _execute_agent(
         self,
@@ -367,6 +608,7 @@ class AgentOrchestrator:
         """Execute a single agent with error handling and Sentry context."""
         
         if self.is_cancelled:
+            # Cancel requested between phases, before the task was interrupted
             raise asyncio.CancelledError()
         
         # Phase 3: Sentry span + tag for per-agent tracing
@@ -378,13 +620,28 @@ class AgentOrchestrator:
 
             try:
                 agent.reset()
-                result = await asyncio.wait_for(
-                    agent.execute(context),
-                    timeout=agent.timeout
-                )
+                self._agent_states[agent_key].update(agent.get_state())
+                sub_context = _slice_context(agent, context)
+
+                # Reuse a previous run's output for identical inputs
+                # (retries, supervised rewinds, repeated queries)
+                cache_inputs = None
+                if agent.cacheable:
+                    cache_inputs = {k: v for k, v in sub_context.items() if k != "memory"}
+                    cached = await get_redis().get_agent_cache(agent_key, cache_inputs)
+                    if cached is not None:
+                        span.set_data("cache_hit", True)
+                        await self._mark_agent_reused(agent, agent_key)
+                        return cached
+
+                async with asyncio.timeout(agent.timeout):
+                    result = await agent.execute(sub_context)
+
+                if cache_inputs is not None and result.get("status") != "failed":
+                    await get_redis().set_agent_cache(agent_key, cache_inputs, result)
                 return result
                 
-            except asyncio.TimeoutError:
+            except TimeoutError:
                 logger.error(f"Agent {agent.name} timed out")
                 sentry_sdk.capture_message(f"Agent {agent.name} timed out", level="warning")
                 await self._notify_progress(
@@ -407,6 +664,76 @@ class AgentOrchestrator:
                     "error": str(e)
                 }
     
+    async def _execute_parallel(self, *steps: Awaitable[Any]) -> List[Any]:
+        """
+        Run independent workflow steps concurrently.
+
+        Returns results in the order given.  Steps run in a TaskGroup, so
+        the first failure cancels the siblings and is re-raised.
+        """
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(step) for step in steps]
+        except BaseExceptionGroup as eg:
+            raise eg.exceptions[0]
+        return [task.result() for task in tasks]
+    
+    async def _run_research(
+        self,
+        session_id: str,
+        context: Dict[str, Any],
+        query: str,
+        max_sources: int
+    ) -> Dict[str, Any]:
+        """Run the Researcher, persist its output and retry once on 0 sources."""
+        researcher_result = await self._execute_agent(
+            self.researcher, context, "researcher"
+        )
+        
+        if researcher_result.get("status") == "failed":
+            return researcher_result
+
+        # Persist sources + raw findings to MongoDB; do NOT put them
+        # into context so downstream agents query the DB.
+        await self._persist_researcher_output(session_id, researcher_result)
+        # Verify sources actually landed in MongoDB
+        source_count = await SourceRepository.count_by_research(session_id)
+        if source_count == 0:
+            logger.warning("0 sources persisted after researcher run — retrying with broadened query")
+            sentry_sdk.capture_message(
+                f"0 sources persisted for session {session_id}, retrying with broader query",
+                level="warning",
+            )
+            await self._notify_progress(
+                "researcher", "in_progress", 30,
+                "No sources found — retrying with a broader search…"
+            )
+            # Build a broader retry context
+            retry_context = {**context}
+            retry_context["query"] = f"{query} overview research analysis"
+            retry_context["max_sources"] = max(max_sources, 100)
+            retry_result = await self._execute_agent(
+                self.researcher, retry_context, "researcher"
+            )
+            if retry_result.get("status") != "failed":
+                researcher_result = retry_result
+                await self._persist_researcher_output(session_id, retry_result)
+                source_count = await SourceRepository.count_by_research(session_id)
+                logger.info(f"Retry persisted {source_count} sources")
+            else:
+                logger.error("Retry also failed — continuing with 0 sources")
+        return researcher_result
+    
+    async def _mark_agent_reused(self, agent: BaseAgent, agent_key: str):
+        """Report an agent as completed when its output is reused."""
+        agent.status = AgentStatus.COMPLETED
+        agent.progress = 100
+        self._agent_states[agent_key].update(agent.get_state())
+        await self._notify_progress(
+            agent_key, "completed", 100,
+            f"{agent.name} reused cached results"
+        )
+    
     async def _checkpoint(self, checkpoint_name: str, data: Dict[str, Any]):
         """Handle checkpoint in supervised mode."""
         
@@ -424,14 +751,14 @@ class AgentOrchestrator:
     async def _handle_rejection(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """Handle research rejection."""
         
-        self.current_phase = WorkflowPhase.FAILED
+        self.current_phase = WorkflowPhase.FAILED.value
         self.is_running = False
         
         return {
             "status": "rejected",
             "session_id": self.session_id,
             "message": result.get("message", "Research not approved"),
-            "started_at": self.started_at.isoformat() if self.started_at else None
+            "started_at": self._started_at_iso
         }
     
     async def _handle_failure(
@@ -441,7 +768,7 @@ class AgentOrchestrator:
     ) -> Dict[str, Any]:
         """Handle agent failure."""
         
-        self.current_phase = WorkflowPhase.FAILED
+        self.current_phase = WorkflowPhase.FAILED.value
         self.is_running = False
         
         error_msg = result.get("error", "Unknown error")
@@ -455,7 +782,7 @@ class AgentOrchestrator:
         return {
             "status": "failed",
             "session_id": self.session_id,
-            "phase": self.current_phase.value,
+            "phase": self.current_phase,
             "failed_at": agent_name,
             "error": error_msg,
             "partial_results": self.results
@@ -563,10 +890,22 @@ class AgentOrchestrator:
         return mapping.get((source_type or "").lower(), "other")
 
     def _build_final_response(self) -> Dict[str, Any]:
-        """Build the final response with all results."""
-        
-        report_data = self.results.get("report_generator", {}).get("report", {})
+        """
+        Build the final response with all results.
+
+        The response is built once per completed workflow and cached on
+        ``self._final_response``; later calls return the cached dict.
+        Payload lists (sources, findings, patterns, ...) are the same
+        objects held in ``self.results`` — never copy them here, or peak
+        memory doubles for source-heavy sessions.
+        """
+        if self._final_response is not None:
+            return self._final_response
+
+        researcher_data = self.results.get("researcher", {})
+        analyst_data = self.results.get("analyst", {})
         fact_check_data = self.results.get("fact_checker", {})
+        report_data = self.results.get("report_generator", {}).get("report") or {}
         
         return {
             "status": "completed",
@@ -584,27 +923,25 @@ class AgentOrchestrator:
             },
             
             # Research data
-            "sources": self.results.get("researcher", {}).get("sources", []),
-            "sources_count": self.results.get("researcher", {}).get("sources_count", {}),
+            "sources": researcher_data.get("sources", []),
+            "sources_count": researcher_data.get("sources_count", {}),
             
             # Analysis data
             "findings": fact_check_data.get("validated_findings", []),
-            "patterns": self.results.get("analyst", {}).get("patterns", []),
-            "key_insights": self.results.get("analyst", {}).get("key_insights", []),
-            "contradictions": self.results.get("analyst", {}).get("contradictions", []),
+            "patterns": analyst_data.get("patterns", []),
+            "key_insights": analyst_data.get("key_insights", []),
+            "contradictions": analyst_data.get("contradictions", []),
             
             # Confidence data
             "confidence_summary": fact_check_data.get("confidence_summary", {}),
             "bias_analysis": fact_check_data.get("bias_analysis", {}),
             
             # Metadata
+            # Timestamps stay datetimes; MongoDB and ORJSONResponse encode them natively
             "metadata": {
-                "started_at": self.started_at.isoformat() if self.started_at else None,
-                "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-                "duration_seconds": (
-                    (self.completed_at - self.started_at).total_seconds()
-                    if self.completed_at and self.started_at else None
-                ),
+                "started_at": self.started_at,
+                "completed_at": self.completed_at,
+                "duration_seconds": self._duration_seconds,
                 "agents_executed": list(self.results.keys()),
                 "errors": self.errors if self.errors else None
             }
@@ -613,26 +950,20 @@ class AgentOrchestrator:
     def get_status(self) -> Dict[str, Any]:
         """Get current orchestrator status."""
         
-        agent_states = {
-            "user_proxy": self.user_proxy.get_state(),
-            "researcher": self.researcher.get_state(),
-            "analyst": self.analyst.get_state(),
-            "fact_checker": self.fact_checker.get_state(),
-            "report_generator": self.report_generator.get_state()
-        }
+        agent_states = dict(self._agent_states)
         
         # Calculate overall progress
-        total_progress = sum(a["progress"] for a in agent_states.values())
-        overall_progress = total_progress // 5
+        total_progress = sum(map(_get_progress, agent_states.values()))
+        overall_progress = total_progress // len(agent_states)
         
         return {
             "session_id": self.session_id,
-            "phase": self.current_phase.value,
+            "phase": self.current_phase,
             "is_running": self.is_running,
             "is_cancelled": self.is_cancelled,
             "overall_progress": overall_progress,
             "agents": agent_states,
-            "started_at": self.started_at.isoformat() if self.started_at else None
+            "started_at": self._started_at_iso
         }
     
     async def cancel(self):
@@ -645,3 +976,9 @@ class AgentOrchestrator:
             "orchestrator", "cancelled", 0,
             "Research cancelled by user"
         )
+        
+        # Interrupt the in-flight agent (and any parallel steps under its
+        # TaskGroup) instead of waiting for the next phase boundary.
+        task = self._workflow_task
+        if self.is_running and task is not None and task is not asyncio.current_task() and not task.done():
+            task.cancel()
@@ -6,16 +6,80 @@ Phase 1: reads validated findings, sources, insights, and confidence data
 from MongoDB by session_id instead of receiving them in the context dict.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from collections import Counter, OrderedDict
 from datetime import datetime
-import json
+import asyncio
+import hashlib
+import numpy as np
+import orjson
 import re
 
 from app.agents.base_agent import BaseAgent, AgentStatus
+from app.agents.memory import WorkflowMemory
 from app.tools.formatting_tools import FormattingTools
 from app.config import settings
 from app.utils.logging import logger
+from app.utils.llm_cache import cached_think, normalize_query
 from app.database.repositories import SourceRepository, ResearchRepository
+from app.services.redis_cache import get_redis
+
+
+# Quality score weights (maximum score 5.0)
+_SOURCE_WEIGHT = 1.5      # source coverage, saturating at 100 sources
+_VERIFIED_WEIGHT = 2.0    # share of findings verified
+_CONFIDENCE_WEIGHT = 1.5  # overall fact-check confidence
+
+# Context keys tried, in order, when no validated findings are available
+_FALLBACK_FINDINGS_KEYS = ("organized_findings", "consolidated_findings", "raw_findings")
+
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+
+# Findings block budget for section prompts, in characters (~4 per token)
+_FINDING_CHARS = 400
+_FINDINGS_BUDGET = 6000
+
+# Recently drafted titles by normalized query, checked before Redis
+_TITLE_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_TITLE_CACHE_SIZE = 1024
+
+
+def _clip(text: str, limit: int) -> str:
+    """Cut ``text`` to at most ``limit`` characters on a word boundary."""
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(" ", 0, limit + 1)
+    return text[:cut if cut > 0 else limit].rstrip()
+
+
+def _weighted_quality(n_sources, verified_ratio, confidence):
+    """The weighted quality formula, for scalars or arrays alike (capped at 5)."""
+    quality = (
+        np.minimum(np.asarray(n_sources, dtype=float) / 100, 1.0) * _SOURCE_WEIGHT +
+        np.asarray(verified_ratio, dtype=float) * _VERIFIED_WEIGHT +
+        np.asarray(confidence, dtype=float) * _CONFIDENCE_WEIGHT
+    )
+    return np.minimum(quality, 5.0)
+
+
+def quality_score(n_sources: int, verified_ratio: float, confidence: float) -> float:
+    """
+    Quality score (0-5) of one report.
+
+    These three scalars are the score's whole input; the arithmetic is
+    cheaper than hashing them, so the result is not memoized.
+    """
+    return round(float(_weighted_quality(n_sources, verified_ratio, confidence)), 1)
+
+
+def score_batch(n_sources, verified_ratio, confidence):
+    """
+    Quality scores (0-5) for many reports at once.
+
+    Takes equal-length arrays (or sequences) and returns a NumPy array;
+    same formula as ``quality_score``, rounded with NumPy.
+    """
+    return _weighted_quality(n_sources, verified_ratio, confidence).round(1)
 
 
 class ReportGeneratorAgent(BaseAgent):
@@ -30,6 +94,10 @@ class ReportGeneratorAgent(BaseAgent):
     - Create executive summaries
     """
     
+    required_context = frozenset({
+        "query", "session_id", "memory", "report_format", "citation_style",
+    })
+    
     def __init__(self):
         system_prompt = """You are an expert report writer who creates professional, data-rich research reports.
 
@@ -66,6 +134,42 @@ Your reports should be publication-ready with zero placeholder text."""
         )
         
         self.formatting_tools = FormattingTools()
+        # Caps concurrent section-writing LLM calls (provider rate limits)
+        self._llm_sem = asyncio.Semaphore(settings.max_parallel_llm)
+        # Inputs pre-loaded by ``prepare`` while the Fact-Checker runs
+        self._prepared: Optional[Dict[str, Any]] = None
+    
+    def release(self):
+        """Clear session state, including inputs left over from ``prepare``."""
+        super().release()
+        self._prepared = None
+    
+    async def prepare(self, context: Dict[str, Any]) -> None:
+        """
+        Pre-load report inputs that don't depend on fact-checking.
+
+        The orchestrator runs this alongside the Fact-Checker: it loads the
+        session's sources from MongoDB and drafts the report title.  The
+        next ``execute`` call for the same session consumes the result.
+        """
+        query = context.get("query", "")
+        session_id = context.get("session_id", "")
+        prepared: Dict[str, Any] = {"query": query, "session_id": session_id}
+
+        memory: Optional[WorkflowMemory] = context.get("memory")
+
+        try:
+            if memory is not None and memory.sources is not None:
+                prepared["sources"] = memory.sources
+            elif session_id:
+                source_docs = await SourceRepository.get_by_research(session_id)
+                prepared["sources"] = [self._source_doc_to_dict(s) for s in source_docs]
+            prepared["title"] = await self._generate_title(query)
+        except Exception as e:
+            logger.warning(f"Report preparation failed, loading during execute instead: {e}")
+            return
+
+        self._prepared = prepared
     
     async def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -78,6 +182,13 @@ Your reports should be publication-ready with zero placeholder text."""
         session_id = context.get("session_id", "")
         report_format = context.get("report_format", "markdown")
         citation_style = context.get("citation_style", "APA")
+        memory: Optional[WorkflowMemory] = context.get("memory")
+
+        # Use inputs pre-loaded during fact-checking when they match this run
+        prepared = self._prepared or {}
+        self._prepared = None
+        if prepared.get("session_id") != session_id or prepared.get("query") != query:
+            prepared = {}
 
         # ── Phase 1: query MongoDB ────────────────────────────────
         sources: List[Dict[str, Any]] = []
@@ -86,10 +197,24 @@ Your reports should be publication-ready with zero placeholder text."""
         confidence_summary: Dict[str, Any] = {}
 
         if session_id:
-            source_docs = await SourceRepository.get_by_research(session_id)
-            sources = [self._source_doc_to_dict(s) for s in source_docs]
-
-            pipeline = await ResearchRepository.get_pipeline_data(session_id)
+            if "sources" in prepared:
+                sources = prepared["sources"]
+            elif memory is not None and memory.sources is not None:
+                sources = memory.sources
+            else:
+                source_docs = await SourceRepository.get_by_research(session_id)
+                sources = [self._source_doc_to_dict(s) for s in source_docs]
+
+            if memory is not None and memory.confidence_summary is not None:
+                # Fact-checking has run; everything downstream needs is in memory
+                pipeline = {
+                    "validated_findings": memory.validated_findings or [],
+                    "key_insights": memory.key_insights or [],
+                    "confidence_summary": memory.confidence_summary,
+                    "organized_findings": memory.organized_findings or [],
+                }
+            else:
+                pipeline = await ResearchRepository.get_pipeline_data(session_id)
             findings = pipeline.get("validated_findings", [])
             key_insights = pipeline.get("key_insights", [])
             confidence_summary = pipeline.get("confidence_summary", {})
@@ -106,11 +231,10 @@ Your reports should be publication-ready with zero placeholder text."""
 
         # Extra fallback for contexts missing validated_findings
         if not findings:
-            findings = context.get("organized_findings", [])
-        if not findings:
-            findings = context.get("consolidated_findings", [])
-        if not findings:
-            findings = context.get("raw_findings", [])
+            findings = next(
+                (context[key] for key in _FALLBACK_FINDINGS_KEYS if context.get(key)),
+                []
+            )
         # ──────────────────────────────────────────────────────────
         
         logger.info(f"Report Generator starting for: {query} ({len(findings)} findings, {len(sources)} sources)")
@@ -126,79 +250,105 @@ Your reports should be publication-ready with zero placeholder text."""
             await self._set_status(AgentStatus.IN_PROGRESS)
             await self._update_progress(5, "Planning report structure...")
             
-            # Step 1: Generate report title
-            title = await self._generate_title(query)
+            # Whole-report reuse: everything but the PDF is determined by
+            # these inputs, so an identical research run skips every LLM call
+            cache = get_redis()
+            plan_key = self._plan_key(
+                query, findings, key_insights, sources, confidence_summary, citation_style
+            )
+            report = await cache.get(plan_key)
+            if report is not None:
+                logger.info(f"Reusing cached report for: {query}")
+                await self._update_progress(85, "Reusing previously generated report...")
+            else:
+                # Steps 1-2: Title (may already be drafted by prepare) and
+                # section structure are independent, so run them together
+                await self._update_progress(15, "Structuring report sections...")
+                title = prepared.get("title")
+                if title:
+                    sections = await self._structure_sections(query, findings, key_insights)
+                else:
+                    title, sections = await self._plan_report(query, findings, key_insights)
             
-            # Step 2: Structure sections
-            await self._update_progress(15, "Structuring report sections...")
-            sections = await self._structure_sections(query, findings, key_insights)
+                # Step 3: Write section content
+                await self._update_progress(30, "Writing report content...")
+                written_sections = await self._write_sections(
+                    query, sections, findings, sources,
+                    partitions=self._partition_findings(findings)
+                )
             
-            # Step 3: Write section content
-            await self._update_progress(30, "Writing report content...")
-            written_sections = await self._write_sections(query, sections, findings, sources)
+                # Step 4: Generate executive summary
+                await self._update_progress(55, "Creating executive summary...")
+                summary = await self._generate_executive_summary(
+                    query, written_sections, confidence_summary
+                )
             
-            # Step 4: Generate executive summary
-            await self._update_progress(55, "Creating executive summary...")
-            summary = await self._generate_executive_summary(
-                query, written_sections, confidence_summary
-            )
+                # Step 5: Generate Markdown report
+                await self._update_progress(70, "Generating Markdown report...")
+                markdown_content = await self.formatting_tools.generate_markdown(
+                    title=title,
+                    sections=written_sections,
+                    sources=sources[:100],  # Limit citations
+                    citation_style=citation_style
+                )
             
-            # Step 5: Generate Markdown report
-            await self._update_progress(70, "Generating Markdown report...")
-            markdown_content = await self.formatting_tools.generate_markdown(
-                title=title,
-                sections=written_sections,
-                sources=sources[:100],  # Limit citations
-                citation_style=citation_style
-            )
+                # Insert summary after title
+                markdown_with_summary = self._insert_summary(markdown_content, summary)
             
-            # Insert summary after title
-            markdown_with_summary = self._insert_summary(markdown_content, summary)
+                # Calculate quality score
+                quality_score = self._calculate_quality_score(
+                    findings, sources, confidence_summary
+                )
+                
+                report = {
+                    "title": title,
+                    "summary": summary,
+                    "markdown_content": markdown_with_summary,
+                    "html_content": "",
+                    "sections": written_sections,
+                    "citation_style": citation_style,
+                    "quality_score": quality_score
+                }
+                await cache.set(plan_key, report)
             
-            # Step 6: Generate HTML if needed
-            await self._update_progress(85, "Generating HTML version...")
-            html_content = await self.formatting_tools.generate_html(
-                title=title,
-                markdown_content=markdown_with_summary
-            )
+            # Step 6: Generate HTML only for formats that render from it;
+            # markdown-only runs skip the pass (the report API renders it
+            # on demand)
+            if report_format in ("html", "pdf") and not report["html_content"]:
+                await self._update_progress(85, "Generating HTML version...")
+                report["html_content"] = await self.formatting_tools.generate_html(
+                    title=report["title"],
+                    markdown_content=report["markdown_content"]
+                )
+                await cache.set(plan_key, report)
             
             # Step 7: Generate PDF if requested
+            # (never cached: binary, and only some runs need it)
             pdf_bytes = None
             if report_format == "pdf":
                 await self._update_progress(92, "Generating PDF version...")
                 pdf_bytes = await self.formatting_tools.generate_pdf(
-                    title=title,
-                    html_content=html_content
+                    title=report["title"],
+                    html_content=report["html_content"]
                 )
             
-            # Calculate quality score
-            quality_score = self._calculate_quality_score(
-                findings, sources, confidence_summary
-            )
+            report["pdf_bytes"] = pdf_bytes
             
             await self._update_progress(100, "Report generation complete!")
             await self._set_status(AgentStatus.COMPLETED)
             
+            generated_at = datetime.utcnow().isoformat()
             return {
                 "status": "completed",
                 "query": query,
-                "report": {
-                    "title": title,
-                    "summary": summary,
-                    "markdown_content": markdown_with_summary,
-                    "html_content": html_content,
-                    "pdf_bytes": pdf_bytes,
-                    "sections": written_sections,
-                    "citation_style": citation_style,
-                    "quality_score": quality_score
-                },
+                "report": report,
                 "metadata": {
                     "total_sources": len(sources),
                     "total_findings": len(findings),
                     "confidence_level": confidence_summary.get("confidence_level", "medium"),
-                    "generated_at": datetime.utcnow().isoformat()
+                    "generated_at": generated_at
                 },
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": generated_at
             }
             
         except Exception as e:
@@ -210,9 +360,36 @@ Your reports should be publication-ready with zero placeholder text."""
                 "report": None
             }
     
+    async def _plan_report(
+        self,
+        query: str,
+        findings: List[Dict[str, Any]],
+        insights: List[str]
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Draft the title and section structure concurrently.
+
+        Runs in a TaskGroup so a failed structuring call cancels the
+        in-flight title request instead of orphaning it.
+        """
+        try:
+            async with asyncio.TaskGroup() as tg:
+                title = tg.create_task(self._generate_title(query))
+                sections = tg.create_task(
+                    self._structure_sections(query, findings, insights)
+                )
+        except BaseExceptionGroup as eg:
+            raise eg.exceptions[0]
+        return title.result(), sections.result()
+    
     async def _generate_title(self, query: str) -> str:
         """Generate a professional report title."""
         
+        title_key = f"title:{normalize_query(query)}"
+        if title_key in _TITLE_CACHE:
+            _TITLE_CACHE.move_to_end(title_key)
+            return _TITLE_CACHE[title_key]
+        
         prompt = f"""Generate a professional, concise report title for this specific research query.
 
 Query: {query}
@@ -227,13 +404,17 @@ The title should:
 Return only the title, nothing else."""
         
         try:
-            title = await self.think(prompt)
+            # Rewordings of the same query reuse one drafted title
+            title = await cached_think(self, prompt, key_text=title_key)
             title = title.strip().strip('"\'')
             # Safety check: if the LLM returned a suspiciously generic title,
             # fall back to the user's query
             if len(title) < 5 or not any(w.lower() in title.lower() for w in query.split()[:3] if len(w) > 3):
                 logger.warning(f"Title '{title}' seems unrelated to query '{query}', using fallback")
                 return f"Research Report: {query[:80]}"
+            _TITLE_CACHE[title_key] = title
+            if len(_TITLE_CACHE) > _TITLE_CACHE_SIZE:
+                _TITLE_CACHE.popitem(last=False)
             return title
         except Exception as e:
             logger.warning(f"Title generation failed: {e}")
@@ -250,26 +431,19 @@ Return only the title, nothing else."""
         # Use formatting tools to structure findings
         sections = await self.formatting_tools.structure_findings(findings, query)
         
-        # Ensure we have key sections
-        section_titles = [s.get("title", "").lower() for s in sections]
+        # Ensure we have key sections.  One newline-joined string keeps the
+        # substring checks from matching across title boundaries.
+        section_titles = "\n".join(s.get("title", "") for s in sections).lower()
         
         # Add methodology section if not present
-        if not any("method" in t for t in section_titles):
-            sections.insert(0, {
-                "title": "Research Methodology",
-                "content": "",
-                "order": 0
-            })
+        if "method" not in section_titles:
+            sections.insert(0, {"title": "Research Methodology", "content": ""})
         
         # Add conclusions section if not present
-        if not any("conclusion" in t for t in section_titles):
-            sections.append({
-                "title": "Conclusions and Recommendations",
-                "content": "",
-                "order": len(sections)
-            })
-        
-        # Reorder
+        if "conclusion" not in section_titles:
+            sections.append({"title": "Conclusions and Recommendations", "content": ""})
+        
+        # Number sections in their final order
         for i, section in enumerate(sections):
             section["order"] = i + 1
         
@@ -280,41 +454,141 @@ Return only the title, nothing else."""
         query: str,
         sections: List[Dict[str, Any]],
         findings: List[Dict[str, Any]],
-        sources: List[Dict[str, Any]]
+        sources: List[Dict[str, Any]],
+        partitions: Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = None
     ) -> List[Dict[str, Any]]:
-        """Write detailed content for each section."""
+        """
+        Write detailed content for each section.
+
+        One batched LLM call drafts every section; any section it misses
+        is written by its own call, concurrently.  LLM calls are bounded
+        by ``_llm_sem`` inside the section writers.  ``partitions`` is the
+        ``_partition_findings`` result, when the caller already has it.
+        """
         
-        written_sections = []
+        if not sections:
+            return []
         
-        for i, section in enumerate(sections):
+        # Topic/findings/citations block shared by every section prompt,
+        # built once instead of once per section
+        shared_context = self._section_context(query, findings, sources)
+        batched = await self._write_sections_batched(sections, shared_context)
+        completed = 0
+        
+        async def write_one(i: int, section: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal completed
             title = section.get("title", f"Section {i+1}")
             existing_content = section.get("content", "")
             
-            # Progress update
-            progress = 30 + int((i / len(sections)) * 25)
-            await self._update_progress(progress, f"Writing: {title}...")
-            
             # Generate content based on section type
-            if "methodology" in title.lower():
+            kind = self._classify_section(title)
+            if kind == "methodology":
                 content = await self._write_methodology_section(sources)
-            elif "conclusion" in title.lower():
-                content = await self._write_conclusions_section(query, findings)
+            elif title in batched:
+                content = batched[title]
+            elif kind == "conclusion":
+                content = await self._write_conclusions_section(query, findings, partitions)
             elif existing_content:
                 content = await self._enhance_section_content(
                     title, existing_content, findings
                 )
             else:
                 content = await self._write_section_content(
-                    title, query, findings, sources
+                    title, query, findings, sources, shared_context=shared_context
                 )
             
-            written_sections.append({
+            # Progress update (single event loop, so the counter needs no lock)
+            completed += 1
+            progress = 30 + int((completed / len(sections)) * 25)
+            await self._update_progress(progress, f"Wrote: {title}")
+            
+            return {
                 "title": title,
                 "content": content,
                 "order": section.get("order", i + 1)
-            })
+            }
+        
+        # gather keeps results in section order
+        return list(await asyncio.gather(
+            *(write_one(i, section) for i, section in enumerate(sections))
+        ))
+    
+    @staticmethod
+    def _classify_section(title: str) -> str:
+        """Section kind for writer dispatch: methodology, conclusion or generic."""
+        t = title.lower()
+        if "methodology" in t:
+            return "methodology"
+        if "conclusion" in t:
+            return "conclusion"
+        return "generic"
+    
+    async def _write_sections_batched(
+        self,
+        sections: List[Dict[str, Any]],
+        shared_context: str
+    ) -> Dict[str, str]:
+        """
+        Draft all LLM-written sections in a single call returning JSON.
+
+        Returns ``{section title: content}``; empty when the response
+        cannot be parsed, so callers fall back to per-section writing.
+        """
+        specs = []
+        for i, section in enumerate(sections):
+            title = section.get("title", f"Section {i+1}")
+            kind = self._classify_section(title)
+            if kind == "methodology":
+                continue  # written from source counts, no LLM needed
+            if kind == "conclusion":
+                specs.append(
+                    f'- "{title}": 3-4 paragraphs summarising the main findings with specific data, '
+                    f"their implications, the actual limitations of this research, and 2-3 "
+                    f"specific areas for further research"
+                )
+            elif section.get("content"):
+                specs.append(
+                    f'- "{title}": enhance this draft into 2-4 professional paragraphs:\n'
+                    f'{section["content"][:2000]}'
+                )
+            else:
+                specs.append(f'- "{title}": 3-6 evidence-rich paragraphs (minimum 250 words)')
+        
+        if not specs:
+            return {}
         
-        return written_sections
+        section_list = "\n".join(specs)
+        prompt = f"""Write the following sections of a research report, using the topic, findings and sources above.
+
+Sections:
+{section_list}
+
+Instructions:
+1. Use SPECIFIC data, statistics, percentages, and concrete evidence from the findings
+2. Include inline Markdown hyperlinks to cite sources wherever possible: [Source Title](URL)
+3. NEVER use placeholder text like [topic], [finding], [example], [limitation]
+4. If data is limited for a section, state what is known and clearly identify the gaps
+
+Return ONLY a JSON object mapping each section title exactly as given above to its Markdown content."""
+        
+        try:
+            async with self._llm_sem:
+                response = await cached_think(
+                    self, prompt,
+                    cached_prefix=shared_context
+                )
+            json_match = _JSON_OBJECT_RE.search(response)
+            data = orjson.loads(json_match.group()) if json_match else {}
+        except Exception as e:
+            logger.warning(f"Batched section writing failed, writing sections individually: {e}")
+            return {}
+        
+        if not isinstance(data, dict):
+            return {}
+        return {
+            title: content for title, content in data.items()
+            if isinstance(content, str) and content.strip()
+        }
     
     async def _write_methodology_section(
         self,
@@ -322,23 +596,23 @@ Return only the title, nothing else."""
     ) -> str:
         """Write the methodology section."""
         
-        # Count sources by type
-        source_types = {}
-        for source in sources:
-            stype = source.get("api_source", "other")
-            source_types[stype] = source_types.get(stype, 0) + 1
+        # Count sources by type (the breakdown only needs an aggregate, so
+        # very large source lists are sampled up to the configured cap)
+        source_types = Counter(
+            source.get("api_source", "other")
+            for source in sources[:settings.max_sources_for_methodology]
+        )
         
-        source_summary = ", ".join([
+        source_summary = ", ".join(
             f"{count} from {stype.title()}"
             for stype, count in source_types.items()
-            if count > 0
-        ])
+        )
         
-        # Count source types
-        academic_count = source_types.get("arxiv", 0) + source_types.get("pubmed", 0)
-        news_count = source_types.get("newsapi", 0)
-        web_count = source_types.get("google", 0) + source_types.get("serpapi", 0)
-        wiki_count = source_types.get("wikipedia", 0)
+        # Count source types (Counter yields 0 for missing keys)
+        academic_count = source_types["arxiv"] + source_types["pubmed"]
+        news_count = source_types["newsapi"]
+        web_count = source_types["google"] + source_types["serpapi"]
+        wiki_count = source_types["wikipedia"]
         
         content = f"""This research was conducted using a multi-agent AI system that employs specialized agents for different aspects of the research process:
 
@@ -358,15 +632,29 @@ Return only the title, nothing else."""
         
         return content
     
+    @staticmethod
+    def _partition_findings(
+        findings: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Split findings into (verified, high-confidence) in one pass."""
+        verified: List[Dict[str, Any]] = []
+        high_confidence: List[Dict[str, Any]] = []
+        for f in findings:
+            if f.get("verified", False):
+                verified.append(f)
+            if f.get("confidence_score", 0) > 0.7:
+                high_confidence.append(f)
+        return verified, high_confidence
+    
     async def _write_conclusions_section(
         self,
         query: str,
-        findings: List[Dict[str, Any]]
+        findings: List[Dict[str, Any]],
+        partitions: Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = None
     ) -> str:
         """Write the conclusions section."""
         
-        verified_findings = [f for f in findings if f.get("verified", False)]
-        high_confidence = [f for f in findings if f.get("confidence_score", 0) > 0.7]
+        verified_findings, high_confidence = partitions or self._partition_findings(findings)
         
         # Use ALL findings if no verified ones (don't let empty list produce placeholders)
         display_findings = verified_findings or high_confidence or findings
@@ -401,7 +689,8 @@ INSTRUCTIONS:
 Write in a professional, objective tone. Be specific and data-driven."""
         
         try:
-            return await self.think(prompt)
+            async with self._llm_sem:
+                return await cached_think(self, prompt)
         except Exception as e:
             logger.warning(f"Conclusions generation failed: {e}")
             return f"This research on \"{query}\" identified {len(verified_findings)} verified findings. Further investigation is recommended to explore emerging developments in this area."
@@ -430,23 +719,28 @@ Enhance the content to:
 Write the enhanced content:"""
         
         try:
-            return await self.think(prompt)
+            async with self._llm_sem:
+                return await cached_think(self, prompt)
         except Exception:
             return existing_content
     
-    async def _write_section_content(
+    def _section_context(
         self,
-        title: str,
         query: str,
         findings: List[Dict[str, Any]],
         sources: Optional[List[Dict[str, Any]]] = None
     ) -> str:
-        """Write new section content from scratch."""
-
-        relevant_findings = "\n".join([
-            f"[F{i+1}] {f.get('title', '')}: {f.get('content', '')[:400]}"
-            for i, f in enumerate(findings[:25])
-        ])
+        """Build the topic/findings/citations block shared by section prompts."""
+
+        lines: List[str] = []
+        size = 0
+        for i, f in enumerate(findings[:25]):
+            line = f"[F{i+1}] {f.get('title', '')}: {_clip(f.get('content', ''), _FINDING_CHARS)}"
+            size += len(line) + 1
+            if lines and size > _FINDINGS_BUDGET:
+                break
+            lines.append(line)
+        relevant_findings = "\n".join(lines)
 
         if not relevant_findings:
             relevant_findings = "Limited findings available for this section."
@@ -473,15 +767,32 @@ Write the enhanced content:"""
             lines = [f"  - [{t}]({u})" for u, t in list(citation_map.items())[:30]]
             citation_block = "Available sources for inline citation:\n" + "\n".join(lines) + "\n"
 
-        prompt = f"""Write a detailed, evidence-rich section for a research report.
-
-Report Topic: {query}
-Section Title: {title}
+        return f"""Report Topic: {query}
 
 Available Findings:
 {relevant_findings}
 
-{citation_block}
+{citation_block}"""
+    
+    async def _write_section_content(
+        self,
+        title: str,
+        query: str,
+        findings: List[Dict[str, Any]],
+        sources: Optional[List[Dict[str, Any]]] = None,
+        shared_context: Optional[str] = None
+    ) -> str:
+        """Write new section content from scratch."""
+
+        # Topic, findings and citations are identical for every section;
+        # sending them first as a shared prefix lets the provider cache them
+        if shared_context is None:
+            shared_context = self._section_context(query, findings, sources)
+
+        prompt = f"""Write a detailed, evidence-rich section for a research report, using the topic, findings and sources above.
+
+Section Title: {title}
+
 Instructions:
 1. Write 3-6 well-developed paragraphs directly addressing the section topic
 2. Use SPECIFIC data, statistics, percentages, and concrete evidence from the findings above
@@ -494,7 +805,8 @@ Instructions:
 Write the section (minimum 250 words):"""
 
         try:
-            return await self.think(prompt)
+            async with self._llm_sem:
+                return await cached_think(self, prompt, cached_prefix=shared_context)
         except Exception as e:
             logger.warning(f"Section writing failed: {e}")
             if findings:
@@ -515,39 +827,68 @@ Write the section (minimum 250 words):"""
     ) -> str:
         """Generate executive summary."""
         
-        # Combine section content — use 1500 chars per section for a richer summary
-        full_content = "\n\n".join([
-            f"{s.get('title', '')}\n{s.get('content', '')[:1500]}"
-            for s in sections
-        ])
-
+        confidence_level = confidence_summary.get("confidence_level", "medium")
+        
+        # Methodology + conclusions only, or next to no text: an LLM summary
+        # would add nothing, so use a deterministic one
+        if len(sections) <= 2 or sum(len(s.get("content", "")) for s in sections) < 500:
+            return (
+                f"This report examines {query}. Based on {len(sections)} sections of "
+                f"analysis, the key insights are summarized below.\n\n"
+                f"*Research Confidence Level: {confidence_level.upper()}*"
+            )
+        
+        # Section content — use 1500 chars per section for a richer summary;
+        # create_summary stops pulling sections once its prompt budget is full
         summary = await self.formatting_tools.create_summary(
-            content=full_content,
+            content=((s.get('title', ''), s.get('content', '')[:1500]) for s in sections[:20]),
             max_length=1200
         )
         
         # Add confidence note
-        confidence_level = confidence_summary.get("confidence_level", "medium")
         summary += f"\n\n*Research Confidence Level: {confidence_level.upper()}*"
         
         return summary
     
+    def _plan_key(
+        self,
+        query: str,
+        findings: List[Dict[str, Any]],
+        key_insights: List[str],
+        sources: List[Dict[str, Any]],
+        confidence_summary: Dict[str, Any],
+        citation_style: str
+    ) -> str:
+        """Cache key fingerprinting every input the generated report depends on."""
+        fingerprint = orjson.dumps({
+            "model": self.model,
+            "query": query,
+            "findings": findings,
+            "insights": key_insights,
+            "sources": [s.get("url", "") for s in sources],
+            "confidence": confidence_summary,
+            "citation_style": citation_style,
+        }, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        return f"rc:report:{hashlib.sha256(fingerprint).hexdigest()}"
+    
     def _insert_summary(self, markdown: str, summary: str) -> str:
         """Insert executive summary after the title."""
         
-        lines = markdown.split('\n')
-        
-        # Find where to insert (after title and metadata)
-        insert_index = 0
-        for i, line in enumerate(lines):
-            if line.startswith('---'):
-                insert_index = i + 1
-                break
-        
         summary_section = f"\n## Executive Summary\n\n{summary}\n"
-        lines.insert(insert_index, summary_section)
         
-        return '\n'.join(lines)
+        # Insert after the first line starting with '---' (end of the title
+        # and metadata); slicing avoids splitting the report into lines
+        if markdown.startswith('---'):
+            rule = 0
+        else:
+            rule = markdown.find('\n---')
+        if rule == -1:
+            return f"{summary_section}\n{markdown}"
+        
+        line_end = markdown.find('\n', rule + 1)
+        if line_end == -1:
+            return f"{markdown}\n{summary_section}"
+        return f"{markdown[:line_end]}\n{summary_section}{markdown[line_end:]}"
     
     def _calculate_quality_score(
         self,
@@ -557,21 +898,11 @@ Write the section (minimum 250 words):"""
     ) -> float:
         """Calculate overall quality score (0-5)."""
         
-        # Factors
-        source_count_score = min(len(sources) / 100, 1.0)  # Max at 100 sources
-        
-        verified_ratio = confidence_summary.get("verified_findings", 0) / max(len(findings), 1)
-        
-        confidence = confidence_summary.get("overall_confidence", 0.5)
-        
-        # Calculate weighted score
-        quality = (
-            source_count_score * 1.5 +
-            verified_ratio * 2.0 +
-            confidence * 1.5
+        return quality_score(
+            len(sources),
+            confidence_summary.get("verified_findings", 0) / max(len(findings), 1),
+            confidence_summary.get("overall_confidence", 0.5)
         )
-        
-        return round(min(quality, 5.0), 1)
 
     # ── Phase 1 helper ────────────────────────────────────────────
     @staticmethod
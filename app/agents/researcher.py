@@ -3,13 +3,140 @@ Researcher Agent
 Responsible for searching and gathering information from multiple sources.
 """
 
-from typing import Dict, Any, List
+import asyncio
+import hashlib
+import re
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
 
 from app.agents.base_agent import BaseAgent, AgentStatus
 from app.tools.search_tools import SearchTools
 from app.config import settings
 from app.utils.logging import logger
+from app.utils.llm_cache import cached_think
+
+
+_WORD_RE = re.compile(r"\w+")
+_DIGIT_RE = re.compile(r"\d+")
+_SPACE_RE = re.compile(r"\s+")
+
+# Feed/news boilerplate that carries no content ("[+1234 chars]", "Read more…")
+_BOILERPLATE_RE = re.compile(
+    r"\[\+\d+ chars\]|\[removed\]|\b(?:read more|continue reading)\b\s*(?:\.{3}|…)?",
+    re.IGNORECASE
+)
+
+# Word-set Jaccard similarity at which two findings count as duplicates
+_NEAR_DUP_SIMILARITY = 0.85
+
+# Source count at or below which the relevance filter skips the LLM
+_MIN_LLM_FILTER_SOURCES = 20
+
+# Keyword score at which a source is relevant without asking the LLM
+_AUTO_ACCEPT_SCORE = 0.75
+
+# Prompt budgets for source batches, in characters of title + snippet
+# (~4 per token), and the most sources one batch may hold
+_FILTER_BATCH_CHARS = 6000
+_FILTER_BATCH_MAX = 40
+_EXTRACT_BATCH_CHARS = 10000
+_EXTRACT_BATCH_MAX = 20
+
+# A "FIELD: value" or "---" line of the extraction response format
+_FINDING_LINE_RE = re.compile(
+    r"^[ \t]*(?:(FINDING|SOURCES|CREDIBILITY):(.*?)|---)[ \t\r]*$", re.MULTILINE
+)
+
+# Common words ignored when scoring sources against the query
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'of', 'in', 'on', 'at',
+    'to', 'for', 'and', 'or', 'but', 'not', 'with', 'how', 'what', 'why',
+    'when', 'where', 'which', 'who', 'does', 'do', 'can', 'could', 'would',
+    'should', 'its', 'it', 'this', 'that', 'these', 'those', 'has', 'have',
+    'had', 'will', 'be', 'been', 'being', 'from', 'by', 'about', 'into',
+    'through', 'during', 'before', 'after', 'above', 'below', 'between',
+    'under', 'over', 'then', 'than', 'so', 'if',
+})
+
+
+# Query parameters that only identify the referrer/campaign
+_TRACKING_PARAM_PREFIXES = ("utm_", "fbclid", "gclid")
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Dedup key for a source URL.
+
+    Ignores the scheme, lowercases the host and drops a leading ``www.``,
+    the fragment, a trailing slash and tracking parameters, so trivially
+    different links to one page collapse to the same key.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    query = urlencode([
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(_TRACKING_PARAM_PREFIXES)
+    ])
+    return urlunsplit(("", host, parts.path.rstrip("/"), query, ""))
+
+
+def _prompt_snippet(source: Dict[str, Any], limit: int) -> str:
+    """
+    A source snippet ready for a prompt: feed boilerplate removed,
+    whitespace collapsed and cut to ``limit`` characters on a word boundary,
+    so the character budget is spent on text the LLM can use.
+    """
+    text = _SPACE_RE.sub(" ", _BOILERPLATE_RE.sub(" ", source.get("snippet", "") or "")).strip()
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(" ", 0, limit + 1)
+    return text[:cut if cut > 0 else limit]
+
+
+def _pack_batches(
+    sources: List[Dict[str, Any]],
+    snippet_chars: int,
+    budget: int,
+    max_items: int
+) -> List[Tuple[int, int]]:
+    """
+    Split ``sources`` into consecutive ``(start, end)`` batches.
+
+    Each batch is filled until its titles plus snippets (cut to
+    ``snippet_chars``) reach ``budget`` characters or it holds
+    ``max_items`` sources, so short snippets share fewer prompts and long
+    ones don't overflow a single prompt.
+    """
+    bounds: List[Tuple[int, int]] = []
+    start, used = 0, 0
+    for i, source in enumerate(sources):
+        cost = len(source.get("title", "") or "") + min(len(source.get("snippet", "") or ""), snippet_chars)
+        if i > start and (used + cost > budget or i - start >= max_items):
+            bounds.append((start, i))
+            start, used = i, 0
+        used += cost
+    if start < len(sources):
+        bounds.append((start, len(sources)))
+    return bounds
+
+
+def _content_key(source: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Dedup key for a source's text (title + start of snippet).
+
+    Word-normalized so whitespace/punctuation/case differences between
+    mirrors match; ``None`` when the source has no text to compare.
+    """
+    title = (source.get("title", "") or "")[:120]
+    snippet = (source.get("snippet", "") or "")[:200]
+    words = _WORD_RE.findall(f"{title} {snippet}".lower())
+    if not words:
+        return None
+    return hashlib.blake2b(" ".join(words).encode(), digest_size=16).digest()
 
 
 class ResearcherAgent(BaseAgent):
@@ -24,6 +151,13 @@ class ResearcherAgent(BaseAgent):
     - Parallel search execution
     """
     
+    required_context = frozenset({
+        "query", "focus_areas", "source_preferences",
+        "max_sources", "research_mode", "search_hints",
+    })
+    
+    cacheable = True
+    
     def __init__(self):
         system_prompt = """You are a research expert who searches multiple sources to gather comprehensive, RELEVANT information.
 
@@ -58,6 +192,16 @@ Output structured findings with clear source attribution and concrete data point
         
         self.search_tools = SearchTools()
         self.sources_found: Dict[str, int] = {}
+        self._is_deep = False
+        # Cap concurrent searches and LLM batches (provider rate limits)
+        self._search_sem = asyncio.Semaphore(settings.max_parallel_searches)
+        self._llm_sem = asyncio.Semaphore(settings.max_parallel_llm)
+    
+    def reset(self):
+        """Reset agent state, including per-run search bookkeeping."""
+        super().reset()
+        self.sources_found = {}
+        self._is_deep = False
     
     async def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -86,16 +230,6 @@ Output structured findings with clear source attribution and concrete data point
             await self._set_status(AgentStatus.IN_PROGRESS)
             await self._update_progress(5, "Analyzing query and preparing search strategy...")
             
-            # Generate search queries based on focus areas
-            search_queries = await self._generate_search_queries(query, focus_areas)
-
-            # If UserProxy provided search hints, add as extra query
-            if search_hints and search_hints != query:
-                search_queries.append(search_hints)
-            
-            await self._update_progress(10, f"Generated {len(search_queries)} search queries")
-            
-            # Execute parallel searches
             all_sources = []
             sources_by_api = {
                 "google": [],
@@ -105,32 +239,71 @@ Output structured findings with clear source attribution and concrete data point
                 "wikipedia": []
             }
             
+            # Size per-API results from the number of queries this run can
+            # produce, so the original query can be searched before the
+            # LLM-generated variants exist
+            has_hints = bool(search_hints) and search_hints != query
+            n_queries = min(12 if self._is_deep else 8, 1 + len(focus_areas) + 5) + has_hints
+            
             # Deep mode fetches significantly more per API call
-            base_per_source = max(5, min(15, max_sources // (len(search_queries) * 3)))
+            base_per_source = max(5, min(15, max_sources // (n_queries * 3)))
             results_per_source = min(base_per_source * 2, 25) if self._is_deep else base_per_source
             
-            for i, search_query in enumerate(search_queries):
-                progress = 10 + int((i / len(search_queries)) * 40)
+            apis_done = 0
+
+            # Micro-update callback: fires as each API finishes, for any query
+            async def _on_api_done(api_name, count, done, total):
+                nonlocal apis_done
+                apis_done += 1
+                total_apis = total * n_queries
                 await self._update_progress(
-                    progress,
-                    f"Searching: {search_query[:50]}..."
+                    10 + int((min(apis_done, total_apis) / total_apis) * 40),
+                    f"Fetched {count} results from {api_name} ({apis_done}/{total_apis} API calls done)"
                 )
 
-                # Micro-update callback: fires as each API finishes
-                async def _on_api_done(api_name, count, done, total):
-                    await self._update_progress(
-                        progress + int((done / total) * (40 // len(search_queries))),
-                        f"Fetched {count} results from {api_name} ({done}/{total} APIs done)"
+            async def _search(search_query: str):
+                async with self._search_sem:
+                    return await self.search_tools.search_all(
+                        query=search_query,
+                        max_results_per_source=results_per_source,
+                        on_api_complete=_on_api_done
                     )
 
-                # Execute parallel search across all APIs
-                results = await self.search_tools.search_all(
-                    query=search_query,
-                    max_results_per_source=results_per_source,
-                    on_api_complete=_on_api_done
-                )
-                
-                # Aggregate results
+            # The original query is always searched: start it now so its API
+            # round-trips overlap the query-generation LLM call
+            initial_search = asyncio.create_task(_search(query))
+            try:
+                # Generate search queries based on focus areas
+                search_queries = await self._generate_search_queries(query, focus_areas)
+            except BaseException:
+                initial_search.cancel()
+                raise
+
+            if not search_queries or search_queries[0] != query:
+                search_queries.insert(0, query)
+
+            # If UserProxy provided search hints, add as extra query
+            if has_hints:
+                search_queries.append(search_hints)
+            n_queries = len(search_queries)
+            
+            # Fan the remaining queries out at once; total latency is the
+            # slowest query rather than the sum of all of them
+            await self._update_progress(
+                max(self.progress, 10),
+                f"Generated {len(search_queries)} search queries, searching in parallel..."
+            )
+            results_list = await asyncio.gather(
+                initial_search,
+                *(_search(search_query) for search_query in search_queries[1:]),
+                return_exceptions=True
+            )
+            
+            # Aggregate results in query order
+            for search_query, results in zip(search_queries, results_list):
+                if isinstance(results, Exception):
+                    logger.warning(f"Search failed for '{search_query[:50]}': {results}")
+                    continue
                 for api, items in results.items():
                     sources_by_api[api].extend(items)
                     all_sources.extend(items)
@@ -141,14 +314,25 @@ Output structured findings with clear source attribution and concrete data point
             
             await self._update_progress(55, f"Collected {len(all_sources)} sources, deduplicating...")
             
-            # Deduplicate sources by URL
+            # Deduplicate sources by canonical URL, then by content so
+            # syndicated copies of one article are not filtered twice
             seen_urls = set()
+            seen_content = set()
             unique_sources = []
             for source in all_sources:
                 url = source.get("url", "")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    unique_sources.append(source)
+                if not url:
+                    continue
+                key = _canonical_url(url)
+                if key in seen_urls:
+                    continue
+                seen_urls.add(key)
+                content_key = _content_key(source)
+                if content_key is not None:
+                    if content_key in seen_content:
+                        continue
+                    seen_content.add(content_key)
+                unique_sources.append(source)
             
             await self._update_progress(60, f"Filtering {len(unique_sources)} sources for relevance...")
             
@@ -160,11 +344,9 @@ Output structured findings with clear source attribution and concrete data point
             
             await self._update_progress(80, f"{len(relevant_sources)} relevant sources found (filtered from {len(unique_sources)})...")
             
-            # Count sources by API
-            self.sources_found = {
-                api: len([s for s in relevant_sources if s.get("api_source") == api])
-                for api in sources_by_api.keys()
-            }
+            # Count sources by API in one pass
+            api_counts = Counter(s.get("api_source") for s in relevant_sources)
+            self.sources_found = {api: api_counts[api] for api in sources_by_api}
             self.sources_found["total"] = len(relevant_sources)
             self.sources_found["total_before_filtering"] = len(unique_sources)
             
@@ -225,7 +407,10 @@ Rules:
 Return only the queries, one per line, no numbering or explanation."""
         
         try:
-            response = await self.think(prompt)
+            # The answer doesn't depend on focus-area order, so reorderings
+            # share one cache entry
+            key_text = f"search_queries|{query}|{sorted(a.strip().lower() for a in focus_areas)}"
+            response = await cached_think(self, prompt, key_text=key_text)
             additional_queries = [q.strip() for q in response.strip().split('\n') if q.strip() and len(q.strip()) > 5]
             queries.extend(additional_queries[:5])
         except Exception as e:
@@ -245,51 +430,123 @@ Return only the queries, one per line, no numbering or explanation."""
             return []
         
         # Step 1: Quick keyword-based pre-filtering
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
-        # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'of', 'in', 'on', 'at', 'to', 'for', 'and', 'or', 'but', 'not', 'with', 'how', 'what', 'why', 'when', 'where', 'which', 'who', 'does', 'do', 'can', 'could', 'would', 'should', 'its', 'it', 'this', 'that', 'these', 'those', 'has', 'have', 'had', 'will', 'be', 'been', 'being', 'from', 'by', 'about', 'into', 'through', 'during', 'before', 'after', 'above', 'below', 'between', 'under', 'over', 'then', 'than', 'so', 'if'}
-        query_keywords = query_words - stop_words
-        
-        scored_sources = []
-        for source in sources:
-            title = (source.get("title", "") or "").lower()
-            snippet = (source.get("snippet", "") or "").lower()
-            combined = f"{title} {snippet}"
-            
-            # Count keyword matches
-            keyword_hits = sum(1 for kw in query_keywords if kw in combined)
-            keyword_ratio = keyword_hits / max(len(query_keywords), 1)
-            
-            # Boost academic sources
-            source_type = source.get("source_type", "")
-            type_boost = 1.2 if source_type == "academic" else 1.0
-            
-            relevance_score = keyword_ratio * type_boost
-            source["_relevance_score"] = relevance_score
-            scored_sources.append(source)
+        query_keywords = set(_WORD_RE.findall(query.lower())) - _STOP_WORDS
+        
+        def keyword_hits(source: Dict[str, Any]) -> int:
+            # Whole-word matches: the query set is intersected with the
+            # token stream directly, without building a per-source set
+            text = f"{source.get('title', '') or ''} {source.get('snippet', '') or ''}".lower()
+            return len(query_keywords.intersection(_WORD_RE.findall(text)))
+        
+        # Scores live in an array aligned with ``sources`` rather than on
+        # the source dicts, so the inputs are never mutated
+        scores = np.fromiter(
+            (keyword_hits(s) for s in sources), dtype=np.float32, count=len(sources)
+        )
+        scores /= max(len(query_keywords), 1)
         
-        # Sort by relevance score descending
-        scored_sources.sort(key=lambda s: s.get("_relevance_score", 0), reverse=True)
+        # Boost academic sources
+        is_academic = np.fromiter(
+            (s.get("source_type", "") == "academic" for s in sources), dtype=bool, count=len(sources)
+        )
+        scores[is_academic] *= 1.2
+        
+        # Take top candidates by relevance score, descending (generous to
+        # allow LLM to refine).  Partitioning finds the cutoff score without
+        # sorting the whole list; sources tied at the cutoff are taken in
+        # search order, and the stable sort keeps that order among ties
+        top_k = min(150, len(sources))
+        cutoff = np.partition(scores, len(sources) - top_k)[len(sources) - top_k]
+        above = np.flatnonzero(scores > cutoff)
+        tied = np.flatnonzero(scores == cutoff)[:top_k - len(above)]
+        order = np.sort(np.concatenate((above, tied)))
+        order = order[np.argsort(-scores[order], kind="stable")]
+        ranked = [sources[i] for i in order]
+        ranked_scores = scores[order].tolist()
+        
+        # Small sets skip the LLM call and keep every source, in keyword
+        # order; this trades precision (sources with no keyword hit are
+        # kept too) for one fewer LLM round-trip on thin results
+        if len(ranked) <= _MIN_LLM_FILTER_SOURCES:
+            logger.info(f"Relevance filtering: {len(sources)} sources kept by keyword rank (LLM skipped)")
+            return ranked
+        
+        # Sources matching most query keywords are kept outright; the rest
+        # go to the LLM.  A zero keyword score is not a drop signal: exact
+        # word matching misses plurals, inflections and synonyms
+        n_accepted = sum(score >= _AUTO_ACCEPT_SCORE for score in ranked_scores) if query_keywords else 0
+        accepted = ranked[:n_accepted]  # sorted, so accepted lead
+        candidates = ranked[n_accepted:]
+        candidate_scores = ranked_scores[n_accepted:]
+        
+        if accepted:
+            logger.info(f"[FILTER_AUTOKEEP] {len(accepted)} sources kept on keyword score ≥ {_AUTO_ACCEPT_SCORE}")
+        
+        # Step 2: LLM-based relevance filtering on the remaining candidates
+        # Batches are packed to a prompt budget (one prompt when everything
+        # fits) and are independent, so they are evaluated concurrently
+        bounds = _pack_batches(candidates, 200, _FILTER_BATCH_CHARS, _FILTER_BATCH_MAX)
+        batches = [
+            (candidates[start:end], candidate_scores[start:end])
+            for start, end in bounds
+        ]
+        completed = 0
+        
+        async def filter_one(batch: List[Dict[str, Any]], batch_scores: List[float]) -> List[Dict[str, Any]]:
+            nonlocal completed
+            async with self._llm_sem:
+                selected = await self._filter_batch(query, batch, batch_scores)
+            completed += 1
+            await self._update_progress(
+                62 + int((completed / len(batches)) * 15),
+                f"Evaluated {completed}/{len(batches)} source batches for relevance…"
+            )
+            return selected
         
-        # Take top candidates (generous to allow LLM to refine)
-        candidates = scored_sources[:min(150, len(scored_sources))]
+        await self._update_progress(
+            62, f"Evaluating {len(candidates)} sources for relevance "
+                f"({len(accepted)} kept on keyword match)…"
+        )
+        relevant_sources = accepted + [
+            source
+            for selected in await asyncio.gather(*(filter_one(*b) for b in batches))
+            for source in selected
+        ]
         
-        # Step 2: LLM-based relevance filtering on top candidates
-        # Process in batches of 20
-        relevant_sources = []
-        batch_size = 20
+        # Ensure we have at least some sources (fallback to keyword-filtered)
+        if len(relevant_sources) < 10:
+            logger.warning(f"LLM filtering returned only {len(relevant_sources)} sources, using keyword fallback")
+            seen = {_canonical_url(s.get("url", "")) for s in relevant_sources}
+            for source in ranked[:50]:
+                key = _canonical_url(source.get("url", ""))
+                if key not in seen:
+                    seen.add(key)
+                    relevant_sources.append(source)
+                if len(relevant_sources) >= 50:
+                    break
         
-        for batch_start in range(0, len(candidates), batch_size):
-            batch = candidates[batch_start:batch_start + batch_size]
-            
-            source_list = []
-            for i, source in enumerate(batch):
-                title = source.get("title", "Untitled")
-                snippet = (source.get("snippet", "") or "")[:200]
-                source_list.append(f"[{i}] {title} — {snippet}")
-            
-            prompt = f"""You are a research relevance filter. Evaluate which sources are relevant to this research query.
+        logger.info(f"Relevance filtering: {len(sources)} → {len(relevant_sources)} relevant sources")
+        return relevant_sources
+    
+    async def _filter_batch(
+        self,
+        query: str,
+        batch: List[Dict[str, Any]],
+        scores: List[float]
+    ) -> List[Dict[str, Any]]:
+        """
+        Ask the LLM which sources in one batch are relevant to the query.
+        
+        ``scores`` holds the keyword score of each source in ``batch``.
+        """
+        
+        source_list = []
+        for i, source in enumerate(batch):
+            title = source.get("title", "Untitled")
+            snippet = _prompt_snippet(source, 200)
+            source_list.append(f"[{i}] {title} — {snippet}")
+        
+        prompt = f"""You are a research relevance filter. Evaluate which sources are relevant to this research query.
 
 RESEARCH QUERY: {query}
 
@@ -302,61 +559,41 @@ Be INCLUSIVE — when in doubt, KEEP the source. Only reject sources about a gen
 
 Respond with ONLY a comma-separated list of relevant source indices (e.g., "0, 2, 5, 7").
 If none are relevant, respond with "NONE"."""
+        
+        selected: List[Dict[str, Any]] = []
+        try:
+            response = await cached_think(self, prompt)
+            response = response.strip()
             
-            try:
-                await self._update_progress(
-                    62 + int((batch_start / len(candidates)) * 15),
-                    f"Evaluating sources {batch_start + 1}–{batch_start + len(batch)} of {len(candidates)} for relevance…"
-                )
-                response = await self.think(prompt)
-                response = response.strip()
-                
-                if response.upper() != "NONE":
-                    # Parse indices
-                    import re
-                    selected_indices = set()
-                    indices = re.findall(r'\d+', response)
-                    for idx_str in indices:
-                        idx = int(idx_str)
-                        if 0 <= idx < len(batch):
-                            relevant_sources.append(batch[idx])
-                            selected_indices.add(idx)
-
-                    # Log rejected sources for auditing
-                    for idx, source in enumerate(batch):
-                        if idx not in selected_indices:
-                            title = (source.get("title", "") or "")[:60]
-                            score = source.get("_relevance_score", 0)
-                            logger.info(f"[FILTER_REJECTED] '{title}' (kw_score={score:.2f}) — LLM did not select")
-                else:
-                    # LLM said NONE — log all as rejected
-                    for idx, source in enumerate(batch):
+            if response.upper() != "NONE":
+                # Parse indices
+                selected_indices = set()
+                indices = _DIGIT_RE.findall(response)
+                for idx_str in indices:
+                    idx = int(idx_str)
+                    if 0 <= idx < len(batch):
+                        selected.append(batch[idx])
+                        selected_indices.add(idx)
+
+                # Log rejected sources for auditing
+                for idx, source in enumerate(batch):
+                    if idx not in selected_indices:
                         title = (source.get("title", "") or "")[:60]
-                        score = source.get("_relevance_score", 0)
-                        logger.info(f"[FILTER_REJECTED] '{title}' (kw_score={score:.2f}) — LLM returned NONE")
-            except Exception as e:
-                logger.warning(f"LLM relevance filtering failed for batch: {e}")
-                # Fallback: include sources with decent keyword score
-                for source in batch:
-                    if source.get("_relevance_score", 0) >= 0.1:
-                        relevant_sources.append(source)
-        
-        # Clean up temporary score field
-        for source in relevant_sources:
-            source.pop("_relevance_score", None)
-        
-        # Ensure we have at least some sources (fallback to keyword-filtered)
-        if len(relevant_sources) < 10:
-            logger.warning(f"LLM filtering returned only {len(relevant_sources)} sources, using keyword fallback")
-            for source in scored_sources[:50]:
-                source.pop("_relevance_score", None)
-                if source not in relevant_sources:
-                    relevant_sources.append(source)
-                if len(relevant_sources) >= 50:
-                    break
-        
-        logger.info(f"Relevance filtering: {len(sources)} → {len(relevant_sources)} relevant sources")
-        return relevant_sources
+                        logger.info(f"[FILTER_REJECTED] '{title}' (kw_score={scores[idx]:.2f}) — LLM did not select")
+            else:
+                # LLM said NONE — log all as rejected
+                for idx, source in enumerate(batch):
+                    title = (source.get("title", "") or "")[:60]
+                    logger.info(f"[FILTER_REJECTED] '{title}' (kw_score={scores[idx]:.2f}) — LLM returned NONE")
+        except Exception as e:
+            logger.warning(f"LLM relevance filtering failed for batch: {e}")
+            # Fallback: include sources with decent keyword score
+            selected = [
+                source for source, score in zip(batch, scores)
+                if score >= 0.1
+            ]
+        
+        return selected
     
     async def _extract_key_info(
         self,
@@ -368,21 +605,35 @@ If none are relevant, respond with "NONE"."""
         if not sources:
             return []
         
-        # Process in batches to cover more sources (deep mode covers 60 vs 45)
-        all_findings = []
-        batch_size = 15
+        # Process in batches to cover more sources (deep mode covers 60 vs 45);
+        # batches are packed to a prompt budget and are independent, so they
+        # are extracted concurrently
         max_to_process = 60 if getattr(self, '_is_deep', False) else 45
+        to_process = min(len(sources), max_to_process)
+        bounds = _pack_batches(sources[:to_process], 600, _EXTRACT_BATCH_CHARS, _EXTRACT_BATCH_MAX)
+        completed = 0
 
-        for batch_start in range(0, min(len(sources), max_to_process), batch_size):
-            batch = sources[batch_start:batch_start + batch_size]
+        async def extract_one(start: int, end: int) -> List[Dict[str, Any]]:
+            nonlocal completed
+            async with self._llm_sem:
+                batch_findings = await self._extract_from_batch(query, sources[start:end], start)
+            completed += 1
             await self._update_progress(
-                85 + int((batch_start / min(len(sources), max_to_process)) * 12),
-                f"Extracting findings from sources {batch_start + 1}–{batch_start + len(batch)} of {min(len(sources), max_to_process)}…"
+                85 + int((completed / len(bounds)) * 12),
+                f"Extracted findings from {completed}/{len(bounds)} source batches of {to_process} sources…"
             )
-            batch_findings = await self._extract_from_batch(query, batch, batch_start)
-            all_findings.extend(batch_findings)
-        
-        # Deduplicate similar findings
+            return batch_findings
+
+        await self._update_progress(85, f"Extracting findings from {to_process} sources…")
+        all_findings = [
+            finding
+            for batch_findings in await asyncio.gather(*(extract_one(*b) for b in bounds))
+            for finding in batch_findings
+        ]
+        
+        # Deduplicate similar findings: near-identical wording is collapsed
+        # locally, and only a still-large remainder goes to the LLM
+        all_findings = self._collapse_near_duplicates(all_findings)
         if len(all_findings) > 10:
             all_findings = await self._deduplicate_findings(query, all_findings)
         
@@ -404,7 +655,7 @@ If none are relevant, respond with "NONE"."""
         source_url_index: Dict[int, Dict[str, str]] = {}
         for i, source in enumerate(sources):
             title = source.get("title", "Untitled")
-            snippet = source.get("snippet", "")[:600]
+            snippet = _prompt_snippet(source, 600)
             url = source.get("url", "")
             author = source.get("author", "") or ", ".join(source.get("authors", [])[:2])
             year = source.get("published_at", "")
@@ -442,33 +693,33 @@ CREDIBILITY: [high/medium/low]
 ---"""
         
         try:
-            response = await self.think(prompt)
+            response = await cached_think(self, prompt)
             
             # Parse findings and resolve source indices → {title, url} dicts
             findings = []
             current_finding: Dict[str, Any] = {}
 
-            import re as _re
-            for line in response.split('\n'):
-                line = line.strip()
-                if line.startswith('FINDING:'):
+            # One scan over the response picks out only the field and
+            # separator lines; everything else is ignored as before
+            for match in _FINDING_LINE_RE.finditer(response):
+                field, value = match.group(1), (match.group(2) or "").strip()
+                if field == 'FINDING':
                     if current_finding:
                         findings.append(current_finding)
-                    current_finding = {"content": line[8:].strip(), "type": "insight"}
-                elif line.startswith('SOURCES:'):
-                    raw_refs = line[8:].strip()
+                    current_finding = {"content": value, "type": "insight"}
+                elif field == 'SOURCES':
+                    raw_refs = value
                     current_finding["source_refs"] = raw_refs
                     # Resolve numeric indices to structured source objects
                     resolved: List[Dict[str, str]] = []
-                    for idx_str in _re.findall(r'\d+', raw_refs):
+                    for idx_str in _DIGIT_RE.findall(raw_refs):
                         idx = int(idx_str)
                         if idx in source_url_index:
                             resolved.append(source_url_index[idx])
                     current_finding["resolved_sources"] = resolved
-                elif line.startswith('CREDIBILITY:'):
-                    cred = line[12:].strip().lower()
-                    current_finding["preliminary_credibility"] = cred
-                elif line == '---' and current_finding:
+                elif field == 'CREDIBILITY':
+                    current_finding["preliminary_credibility"] = value.lower()
+                elif field is None and current_finding:  # '---' separator
                     findings.append(current_finding)
                     current_finding = {}
 
@@ -481,6 +732,39 @@ CREDIBILITY: [high/medium/low]
             logger.warning(f"Key info extraction failed: {e}")
             return []
     
+    @staticmethod
+    def _collapse_near_duplicates(
+        findings: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Merge findings whose wording is nearly identical.
+
+        Two findings are duplicates when the Jaccard similarity of their
+        word sets reaches ``_NEAR_DUP_SIMILARITY``.  The longer content is
+        kept and the duplicate's resolved sources are merged into it.
+        """
+        kept: List[Dict[str, Any]] = []
+        kept_words: List[frozenset] = []
+        for finding in findings:
+            words = frozenset(_WORD_RE.findall(finding.get("content", "").lower()))
+            for i, other in enumerate(kept_words):
+                union = len(words | other)
+                if union and len(words & other) / union >= _NEAR_DUP_SIMILARITY:
+                    primary = kept[i]
+                    if len(finding.get("content", "")) > len(primary.get("content", "")):
+                        finding, primary = primary, finding
+                        kept[i], kept_words[i] = primary, words
+                    urls = {s.get("url") for s in primary.get("resolved_sources", [])}
+                    for source in finding.get("resolved_sources", []):
+                        if source.get("url") not in urls:
+                            primary.setdefault("resolved_sources", []).append(source)
+                            urls.add(source.get("url"))
+                    break
+            else:
+                kept.append(finding)
+                kept_words.append(words)
+        return kept
+    
     async def _deduplicate_findings(
         self,
         query: str,
@@ -505,9 +789,8 @@ Return the indices of findings to KEEP (the best/most complete version of each u
 Respond with ONLY a comma-separated list of indices to keep (e.g., "0, 2, 4, 7, 9")."""
         
         try:
-            response = await self.think(prompt)
-            import re
-            indices = [int(x) for x in re.findall(r'\d+', response)]
+            response = await cached_think(self, prompt)
+            indices = [int(x) for x in _DIGIT_RE.findall(response)]
             
             kept = []
             for idx in indices:
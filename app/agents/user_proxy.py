@@ -36,6 +36,11 @@ class UserProxyAgent(BaseAgent):
     - SUPERVISED: Pauses at checkpoints for approval
     """
     
+    required_context = frozenset({
+        "query", "research_mode", "focus_areas", "source_preferences",
+        "max_sources", "report_format", "citation_style",
+    })
+    
     def __init__(self):
         system_prompt = """You are a User Proxy agent representing human oversight in the research process.
 
@@ -71,6 +76,19 @@ Guidelines:
         self._human_input_callback: Optional[Callable] = None
         self._approval_received = False
     
+    def reset(self):
+        """Reset agent state, including the approval/feedback cycle."""
+        super().reset()
+        self.approval_status = ApprovalStatus.PENDING
+        self.feedback = None
+        self.modifications = {}
+        self._approval_received = False
+    
+    def release(self):
+        """Clear session state, including the human input callback."""
+        super().release()
+        self._human_input_callback = None
+    
     def set_human_input_callback(self, callback: Callable):
         """Set callback for requesting human input via WebSocket."""
         self._human_input_callback = callback
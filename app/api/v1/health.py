@@ -10,6 +10,7 @@ from app.models import APIResponse
 from app.database.connection import check_database_connection
 from app.config import settings
 from app.utils.logging import logger
+from app.utils.llm_cache import cache_stats
 
 
 router = APIRouter()
@@ -110,6 +111,7 @@ async def service_info():
             "api_version": "v1",
             "supported_formats": ["markdown", "html", "pdf"],
             "supported_citation_styles": ["APA", "MLA", "Chicago"],
+            "llm_cache": cache_stats(),
             "agents": [
                 "User Proxy",
                 "Researcher",
@@ -320,6 +320,14 @@ async def get_session_report(session_id: str, format: str = Query("markdown")):
             content = report.markdown_content
         elif format == "html":
             content = report.html_content
+            if not content:
+                # Markdown-only runs skip HTML generation; render it now
+                from app.tools.formatting_tools import FormattingTools
+                content = await FormattingTools().generate_html(
+                    title=report.title,
+                    markdown_content=report.markdown_content or ""
+                )
+                await ReportRepository.update_content(report.report_id, html=content)
         else:
             content = report.markdown_content
         
@@ -4,7 +4,8 @@ Real-time bidirectional communication for research progress updates.
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, List, Deque
+from collections import deque
 from datetime import datetime
 import json
 import asyncio
@@ -20,11 +21,16 @@ class ConnectionManager:
     Manages WebSocket connections for research sessions.
     """
     
+    # Recent sequence-numbered agent updates kept per session for replay
+    REPLAY_BUFFER_SIZE = 128
+    
     def __init__(self):
         # Map of session_id -> list of WebSocket connections
         self.active_connections: Dict[str, list[WebSocket]] = {}
         # Map of session_id -> asyncio.Queue for messages
         self.message_queues: Dict[str, asyncio.Queue] = {}
+        # Map of session_id -> ring buffer of recent agent updates
+        self.recent_updates: Dict[str, Deque[dict]] = {}
     
     async def connect(self, websocket: WebSocket, session_id: str):
         """Accept and register a WebSocket connection."""
@@ -87,6 +93,21 @@ class ConnectionManager:
             for conn in disconnected:
                 self.active_connections[session_id].remove(conn)
     
+    def record_update(self, session_id: str, message: dict):
+        """Keep a sequence-numbered update for clients that reconnect."""
+        buffer = self.recent_updates.get(session_id)
+        if buffer is None:
+            buffer = self.recent_updates[session_id] = deque(maxlen=self.REPLAY_BUFFER_SIZE)
+        buffer.append(message)
+    
+    def get_updates_since(self, session_id: str, last_seq: int) -> List[dict]:
+        """Get buffered updates newer than the client's last-seen sequence number."""
+        return [m for m in self.recent_updates.get(session_id, ()) if m["seq"] > last_seq]
+    
+    def clear_updates(self, session_id: str):
+        """Drop the replay buffer once a session's workflow has ended."""
+        self.recent_updates.pop(session_id, None)
+    
     def get_connection_count(self, session_id: str) -> int:
         """Get number of active connections for a session."""
         return len(self.active_connections.get(session_id, []))
@@ -107,7 +128,8 @@ async def send_agent_update(
     progress: int,
     output: Optional[str] = None,
     error: Optional[str] = None,
-    data: Optional[Dict[str, Any]] = None
+    data: Optional[Dict[str, Any]] = None,
+    seq: Optional[int] = None
 ):
     """
     Send agent status update via WebSocket.
@@ -120,9 +142,14 @@ async def send_agent_update(
         "agent": "researcher",
         "status": "in_progress",
         "progress": 65,
+        "seq": 42,
         "timestamp": "2024-01-15T10:30:00.000Z",
         "data": {...}
     }
+    
+    ``seq`` increases monotonically per session; a gap tells the client an
+    update was dropped, and it can send ``{"type": "resume", "last_seq": N}``
+    to have buffered updates replayed.
     """
     message = {
         "type": "agent_status_update",
@@ -138,6 +165,9 @@ async def send_agent_update(
         message["error"] = error
     if data:
         message["data"] = data
+    if seq is not None:
+        message["seq"] = seq
+        manager.record_update(session_id, message)
     
     await manager.broadcast_to_session(session_id, message)
 
@@ -252,7 +282,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
             data = await websocket.receive_text()
             try:
                 message = json.loads(data)
-                await handle_client_message(session_id, message)
+                await handle_client_message(session_id, message, websocket)
             except json.JSONDecodeError:
                 logger.warning(f"Invalid JSON received: {data}")
                 await manager.send_personal_message(websocket, {
@@ -272,8 +302,8 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
         manager.disconnect(websocket, session_id)
 
 
-async def handle_client_message(session_id: str, message: dict):
-    """Handle messages received from WebSocket clients."""
+async def handle_client_message(session_id: str, message: dict, websocket: WebSocket):
+    """Handle a message received from ``websocket``, a client of the session."""
     
     message_type = message.get("type")
     
@@ -323,6 +353,16 @@ async def handle_client_message(session_id: str, message: dict):
                 "timestamp": datetime.utcnow().isoformat()
             })
     
+    elif message_type == "resume":
+        # Replay updates the client missed (detected via a gap in seq) to
+        # that client only; the session's other sockets already have them
+        try:
+            last_seq = int(message.get("last_seq") or 0)
+        except (TypeError, ValueError):
+            last_seq = 0  # unparseable: replay everything still buffered
+        for update in manager.get_updates_since(session_id, last_seq):
+            await manager.send_personal_message(websocket, update)
+    
     elif message_type == "chat_message":
         # Handle real-time chat message
         await handle_chat_message(session_id, message)
@@ -33,6 +33,7 @@ class Settings(BaseSettings):
     # Redis Cache (optional)
     redis_url: Optional[str] = Field(default=None, alias="REDIS_URL")
     cache_ttl: int = Field(default=86400, alias="CACHE_TTL")  # 24 hours
+    agent_cache_ttl: int = Field(default=3600, alias="AGENT_CACHE_TTL")  # 1 hour
     
     # Sentry Error Tracking
     sentry_dsn: Optional[str] = Field(default=None, alias="SENTRY_DSN")
@@ -95,6 +96,9 @@ class Settings(BaseSettings):
     max_sources_default: int = Field(default=300, alias="MAX_SOURCES_DEFAULT")
     agent_timeout: int = Field(default=120, alias="AGENT_TIMEOUT")  # 2 minutes
     max_retries: int = Field(default=3, alias="MAX_RETRIES")
+    max_parallel_llm: int = Field(default=4, alias="MAX_PARALLEL_LLM")  # per agent
+    max_parallel_searches: int = Field(default=8, alias="MAX_PARALLEL_SEARCHES")  # queries in flight
+    max_sources_for_methodology: int = Field(default=500, alias="MAX_SOURCES_FOR_METHODOLOGY")
     
     class Config:
         env_file = ".env"
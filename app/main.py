@@ -22,9 +22,12 @@ if settings.sentry_dsn:
     )
 
 from contextlib import asynccontextmanager
+import asyncio
+import sys
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.api.v1 import research, history, status, health
 from app.api.v1 import documents, settings as settings_api
@@ -34,6 +37,9 @@ from app.middleware.error_handler import error_handler_middleware
 from app.middleware.logging import logging_middleware
 from app.utils.logging import setup_logging, logger
 from app.services.redis_cache import get_redis
+from app.tools.llm_tools import close_http_client
+from app.tools.search_tools import close_search_client
+from app.tools.formatting_tools import shutdown_pdf_pool
 
 
 @asynccontextmanager
@@ -45,6 +51,12 @@ async def lifespan(app: FastAPI):
     # Startup
     setup_logging()
     logger.info("Starting Multi-Agent Research Assistant...")
+
+    # Let tasks that finish without blocking (cache hits, short-circuits)
+    # complete inline instead of paying an event-loop round trip.
+    if sys.version_info >= (3, 12):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        logger.info("Eager task factory enabled")
     
     await connect_to_mongo()
     logger.info("Connected to MongoDB")
@@ -60,6 +72,9 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down...")
     await redis.disconnect()
     logger.info("Disconnected from Redis")
+    await close_http_client()
+    await close_search_client()
+    shutdown_pdf_pool()
     await close_mongo_connection()
     logger.info("Disconnected from MongoDB")
 
@@ -97,6 +112,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
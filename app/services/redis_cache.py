@@ -4,6 +4,7 @@ Provides caching for external API calls and Pub/Sub for real-time progress.
 """
 
 import json
+import orjson
 import hashlib
 import asyncio
 from typing import Optional, Any, Dict, Callable
@@ -121,6 +122,30 @@ class RedisCache:
         await self.set(key, data, ttl)
         logger.debug(f"Cached {api_name} results for: {query[:60]}")
 
+    # -----------------------------------------------------------------
+    # Agent-output caching shortcuts
+    # -----------------------------------------------------------------
+    @staticmethod
+    def _agent_cache_key(agent_name: str, inputs: Dict[str, Any]) -> str:
+        """Deterministic cache key from agent name + canonical JSON inputs."""
+        canonical = orjson.dumps(
+            inputs, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+        h = hashlib.blake2b(agent_name.encode() + b":" + canonical, digest_size=16).hexdigest()
+        return f"rc:agent:{h}"
+
+    async def get_agent_cache(self, agent_name: str, inputs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        key = self._agent_cache_key(agent_name, inputs)
+        result = await self.get(key)
+        if result is not None:
+            logger.info(f"Cache HIT for agent {agent_name}")
+        return result
+
+    async def set_agent_cache(self, agent_name: str, inputs: Dict[str, Any], result: Dict[str, Any]):
+        key = self._agent_cache_key(agent_name, inputs)
+        await self.set(key, result, settings.agent_cache_ttl)
+        logger.debug(f"Cached {agent_name} output")
+
     # -----------------------------------------------------------------
     # Pub / Sub — progress broadcasting
     # -----------------------------------------------------------------
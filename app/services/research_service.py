@@ -101,7 +101,8 @@ class ResearchService:
             status: str,
             progress: int,
             output: Optional[str] = None,
-            error: Optional[str] = None
+            error: Optional[str] = None,
+            seq: Optional[int] = None
         ):
             # Keep a local snapshot of every named agent
             if agent_name in _agent_weights:
@@ -129,6 +130,7 @@ class ResearchService:
                 "overall_progress": overall_progress,
                 "output": output,
                 "error": error,
+                "seq": seq,
             })
             # ──────────────────────────────────────────────────────
 
@@ -141,7 +143,8 @@ class ResearchService:
                 progress=progress,
                 output=output,
                 error=error,
-                data={"overall_progress": overall_progress}
+                data={"overall_progress": overall_progress},
+                seq=seq
             )
             
             # Update database
@@ -232,6 +235,7 @@ class ResearchService:
             # Clean up
             if session_id in self.active_orchestrators:
                 del self.active_orchestrators[session_id]
+            ws_manager.clear_updates(session_id)
     
     async def _update_session_progress(
         self,
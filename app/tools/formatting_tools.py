@@ -4,7 +4,14 @@ Handles Markdown, HTML, and PDF generation with citations.
 """
 
 import re
-from typing import List, Dict, Any, Optional
+import os
+import json
+import orjson
+import asyncio
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Iterable, Tuple, Union
 from datetime import datetime
 import markdown
 from io import BytesIO
@@ -12,118 +19,29 @@ from io import BytesIO
 from app.config import settings
 from app.utils.logging import logger
 from app.tools.llm_tools import LLMTools
+from app.services.redis_cache import get_redis
 
 
-class FormattingTools:
-    """Collection of formatting tools for report generation."""
-    
-    def __init__(self):
-        self.llm = LLMTools()
-    
-    async def generate_markdown(
-        self,
-        title: str,
-        sections: List[Dict[str, Any]],
-        sources: List[Dict[str, Any]],
-        citation_style: str = "APA"
-    ) -> str:
-        """
-        Generate a well-formatted Markdown report.
-        
-        Args:
-            title: Report title
-            sections: List of sections with title and content
-            sources: List of sources for citations
-            citation_style: Citation format (APA, MLA, Chicago)
-            
-        Returns:
-            Formatted Markdown string
-        """
-        logger.info(f"Generating Markdown report: {title}")
-        
-        md_parts = []
-        
-        # Title
-        md_parts.append(f"# {title}\n")
-        
-        # Metadata
-        md_parts.append(f"*Generated on {datetime.utcnow().strftime('%B %d, %Y at %H:%M UTC')}*\n")
-        md_parts.append(f"*{len(sources)} sources analyzed*\n")
-        md_parts.append("---\n")
-        
-        # Table of Contents
-        md_parts.append("## Table of Contents\n")
-        for i, section in enumerate(sections, 1):
-            section_title = section.get("title", f"Section {i}")
-            anchor = section_title.lower().replace(" ", "-").replace(".", "")
-            md_parts.append(f"{i}. [{section_title}](#{anchor})\n")
-        md_parts.append(f"{len(sections) + 1}. [References](#references)\n")
-        md_parts.append("---\n")
-        
-        # Sections
-        for section in sections:
-            section_title = section.get("title", "Untitled Section")
-            section_content = section.get("content", "")
-            
-            md_parts.append(f"## {section_title}\n")
-            md_parts.append(f"{section_content}\n")
-            
-            # Add subsections if present
-            for subsection in section.get("subsections", []):
-                sub_title = subsection.get("title", "")
-                sub_content = subsection.get("content", "")
-                md_parts.append(f"### {sub_title}\n")
-                md_parts.append(f"{sub_content}\n")
-            
-            md_parts.append("\n")
-        
-        # References section
-        md_parts.append("---\n")
-        md_parts.append("## References\n")
-        
-        citations = await self.format_citations(sources, citation_style)
-        md_parts.append(citations)
-        
-        return "\n".join(md_parts)
-    
-    async def generate_html(
-        self,
-        title: str,
-        markdown_content: str
-    ) -> str:
-        """
-        Generate HTML report from Markdown content.
-        
-        Args:
-            title: Report title
-            markdown_content: Markdown formatted content
-            
-        Returns:
-            HTML string
-        """
-        logger.info(f"Generating HTML report: {title}")
-        
-        # Convert Markdown to HTML
-        html_body = markdown.markdown(
-            markdown_content,
-            extensions=[
-                'tables',
-                'fenced_code',
-                'codehilite',
-                'toc',
-                'nl2br'
-            ]
-        )
-        
-        # Wrap in HTML template
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        :root {{
+# Markdown converter built once; extension loading dominates the cost of
+# a one-off ``markdown.markdown()`` call.  Conversion is synchronous, so
+# the event loop never interleaves two renders on it.
+_MD_EXTENSIONS = ['tables', 'fenced_code', 'codehilite', 'toc', 'nl2br']
+_MARKDOWN = markdown.Markdown(extensions=_MD_EXTENSIONS)
+
+
+def _markdown_to_html(text: str) -> str:
+    """Convert Markdown to an HTML fragment with the shared converter."""
+    return _MARKDOWN.reset().convert(text)
+
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+
+
+# Stylesheet embedded in every HTML report (kept out of the f-string so it
+# is not re-formatted per render)
+_HTML_STYLE = """
+        :root {
             --primary-blue: #2563EB;
             --secondary-purple: #7C3AED;
             --text-primary: #111827;
@@ -131,41 +49,41 @@ class FormattingTools:
             --bg-white: #FFFFFF;
             --bg-gray: #F3F4F6;
             --border-color: #E5E7EB;
-        }}
+        }
         
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             line-height: 1.6;
             color: var(--text-primary);
             background-color: var(--bg-gray);
             padding: 2rem;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 900px;
             margin: 0 auto;
             background: var(--bg-white);
             padding: 3rem;
             border-radius: 8px;
             box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        }}
+        }
         
-        h1 {{
+        h1 {
             font-size: 2rem;
             font-weight: 700;
             color: var(--primary-blue);
             margin-bottom: 1rem;
             border-bottom: 3px solid var(--primary-blue);
             padding-bottom: 0.5rem;
-        }}
+        }
         
-        h2 {{
+        h2 {
             font-size: 1.5rem;
             font-weight: 600;
             color: var(--text-primary);
@@ -173,130 +91,360 @@ class FormattingTools:
             margin-bottom: 1rem;
             border-bottom: 1px solid var(--border-color);
             padding-bottom: 0.5rem;
-        }}
+        }
         
-        h3 {{
+        h3 {
             font-size: 1.25rem;
             font-weight: 600;
             color: var(--secondary-purple);
             margin-top: 1.5rem;
             margin-bottom: 0.75rem;
-        }}
+        }
         
-        p {{
+        p {
             margin-bottom: 1rem;
             color: var(--text-primary);
-        }}
+        }
         
-        ul, ol {{
+        ul, ol {
             margin-bottom: 1rem;
             padding-left: 2rem;
-        }}
+        }
         
-        li {{
+        li {
             margin-bottom: 0.5rem;
-        }}
+        }
         
-        a {{
+        a {
             color: var(--primary-blue);
             text-decoration: none;
-        }}
+        }
         
-        a:hover {{
+        a:hover {
             text-decoration: underline;
-        }}
+        }
         
-        blockquote {{
+        blockquote {
             border-left: 4px solid var(--secondary-purple);
             padding-left: 1rem;
             margin: 1rem 0;
             color: var(--text-secondary);
             font-style: italic;
-        }}
+        }
         
-        code {{
+        code {
             background: var(--bg-gray);
             padding: 0.2rem 0.4rem;
             border-radius: 4px;
             font-family: 'JetBrains Mono', monospace;
             font-size: 0.9em;
-        }}
+        }
         
-        pre {{
+        pre {
             background: var(--bg-gray);
             padding: 1rem;
             border-radius: 8px;
             overflow-x: auto;
             margin-bottom: 1rem;
-        }}
+        }
         
-        pre code {{
+        pre code {
             background: none;
             padding: 0;
-        }}
+        }
         
-        hr {{
+        hr {
             border: none;
             border-top: 1px solid var(--border-color);
             margin: 2rem 0;
-        }}
+        }
         
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-bottom: 1rem;
-        }}
+        }
         
-        th, td {{
+        th, td {
             border: 1px solid var(--border-color);
             padding: 0.75rem;
             text-align: left;
-        }}
+        }
         
-        th {{
+        th {
             background: var(--bg-gray);
             font-weight: 600;
-        }}
+        }
         
-        .metadata {{
+        .metadata {
             color: var(--text-secondary);
             font-size: 0.9rem;
             margin-bottom: 1rem;
-        }}
+        }
         
-        .toc {{
+        .toc {
             background: var(--bg-gray);
             padding: 1.5rem;
             border-radius: 8px;
             margin-bottom: 2rem;
-        }}
+        }
         
-        .toc ul {{
+        .toc ul {
             list-style: none;
             padding-left: 1rem;
-        }}
+        }
         
-        .references {{
+        .references {
             font-size: 0.9rem;
-        }}
+        }
         
-        .references p {{
+        .references p {
             margin-bottom: 0.75rem;
             padding-left: 2rem;
             text-indent: -2rem;
-        }}
+        }
         
-        @media print {{
-            body {{
+        @media print {
+            body {
                 background: white;
                 padding: 0;
-            }}
-            .container {{
+            }
+            .container {
                 box-shadow: none;
                 padding: 0;
-            }}
-        }}
-    </style>
+            }
+        }
+"""
+
+
+# =================================================================
+# PDF rendering — CPU-bound WeasyPrint/ReportLab work runs in worker
+# processes so a render does not stall the event loop (and every other
+# session's progress updates) for its duration.
+# =================================================================
+_PDF_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Get the process pool for PDF rendering, creating it on first use."""
+    global _PDF_POOL
+    if _PDF_POOL is None:
+        # spawn: never fork a process that is running an event loop and threads
+        _PDF_POOL = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _PDF_POOL
+
+
+def shutdown_pdf_pool():
+    """Stop the PDF worker processes."""
+    global _PDF_POOL
+    if _PDF_POOL is not None:
+        _PDF_POOL.shutdown(wait=False, cancel_futures=True)
+        _PDF_POOL = None
+
+
+def _render_pdf(title: str, html_content: str) -> bytes:
+    """Render report HTML to PDF bytes (runs in a worker process)."""
+    try:
+        from weasyprint import HTML, CSS
+        
+        # Generate PDF from HTML
+        pdf_bytes = HTML(string=html_content).write_pdf()
+        
+        return pdf_bytes
+        
+    except ImportError:
+        logger.warning("WeasyPrint not available, using fallback PDF generation")
+        
+        # Fallback: Use reportlab for basic PDF
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        
+        buffer = BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=letter)
+        styles = getSampleStyleSheet()
+        
+        # Create custom styles
+        title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            spaceAfter=30
+        )
+        
+        story = []
+        
+        # Add title
+        story.append(Paragraph(title, title_style))
+        story.append(Spacer(1, 12))
+        
+        # Add metadata
+        story.append(Paragraph(
+            f"Generated on {datetime.utcnow().strftime('%B %d, %Y')}",
+            styles['Normal']
+        ))
+        story.append(Spacer(1, 24))
+        
+        # Add content (simplified - strip HTML)
+        clean_text = _TAG_RE.sub('', html_content)
+        paragraphs = clean_text.split('\n\n')
+        
+        for para in paragraphs[:50]:  # Limit for basic fallback
+            if para.strip():
+                story.append(Paragraph(para.strip(), styles['Normal']))
+                story.append(Spacer(1, 12))
+        
+        doc.build(story)
+        
+        return buffer.getvalue()
+
+
+class FormattingTools:
+    """Collection of formatting tools for report generation."""
+    
+    def __init__(self):
+        self.llm = LLMTools()
+    
+    @staticmethod
+    def _content_key(kind: str, inputs: Dict[str, Any]) -> str:
+        """Cache key from a hash of the inputs a rendering depends on."""
+        canonical = orjson.dumps(
+            inputs, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+        h = hashlib.blake2b(canonical, digest_size=16).hexdigest()
+        return f"rc:fmt:{kind}:{h}"
+    
+    async def generate_markdown(
+        self,
+        title: str,
+        sections: List[Dict[str, Any]],
+        sources: List[Dict[str, Any]],
+        citation_style: str = "APA"
+    ) -> str:
+        """
+        Generate a well-formatted Markdown report.
+        
+        Args:
+            title: Report title
+            sections: List of sections with title and content
+            sources: List of sources for citations
+            citation_style: Citation format (APA, MLA, Chicago)
+            
+        Returns:
+            Formatted Markdown string
+        """
+        logger.info(f"Generating Markdown report: {title}")
+        
+        md_parts = []
+        
+        # Title
+        md_parts.append(f"# {title}\n")
+        
+        # Metadata
+        md_parts.append(f"*Generated on {datetime.utcnow().strftime('%B %d, %Y at %H:%M UTC')}*\n")
+        md_parts.append(f"*{len(sources)} sources analyzed*\n")
+        md_parts.append("---\n")
+        
+        # The rest depends only on these inputs (citations embed the
+        # retrieval date, hence the day in the key), so it is cached
+        cache = get_redis()
+        cache_key = self._content_key("md", {
+            "sections": sections,
+            "sources": sources,
+            "style": citation_style,
+            "day": datetime.utcnow().strftime("%Y-%m-%d"),
+        })
+        body = await cache.get(cache_key)
+        if body is None:
+            body = await self._markdown_body(sections, sources, citation_style)
+            await cache.set(cache_key, body)
+        md_parts.append(body)
+        
+        return "\n".join(md_parts)
+    
+    async def _markdown_body(
+        self,
+        sections: List[Dict[str, Any]],
+        sources: List[Dict[str, Any]],
+        citation_style: str
+    ) -> str:
+        """Render the table of contents, sections and references."""
+        md_parts = []
+        
+        # Table of Contents
+        md_parts.append("## Table of Contents\n")
+        for i, section in enumerate(sections, 1):
+            section_title = section.get("title", f"Section {i}")
+            anchor = section_title.lower().replace(" ", "-").replace(".", "")
+            md_parts.append(f"{i}. [{section_title}](#{anchor})\n")
+        md_parts.append(f"{len(sections) + 1}. [References](#references)\n")
+        md_parts.append("---\n")
+        
+        # Sections
+        for section in sections:
+            section_title = section.get("title", "Untitled Section")
+            section_content = section.get("content", "")
+            
+            md_parts.append(f"## {section_title}\n")
+            md_parts.append(f"{section_content}\n")
+            
+            # Add subsections if present
+            for subsection in section.get("subsections", []):
+                sub_title = subsection.get("title", "")
+                sub_content = subsection.get("content", "")
+                md_parts.append(f"### {sub_title}\n")
+                md_parts.append(f"{sub_content}\n")
+            
+            md_parts.append("\n")
+        
+        # References section
+        md_parts.append("---\n")
+        md_parts.append("## References\n")
+        
+        citations = await self.format_citations(sources, citation_style)
+        md_parts.append(citations)
+        
+        return "\n".join(md_parts)
+    
+    async def generate_html(
+        self,
+        title: str,
+        markdown_content: str
+    ) -> str:
+        """
+        Generate HTML report from Markdown content.
+        
+        Args:
+            title: Report title
+            markdown_content: Markdown formatted content
+            
+        Returns:
+            HTML string
+        """
+        logger.info(f"Generating HTML report: {title}")
+        
+        # Output is a pure function of the inputs; reuse identical renders
+        cache = get_redis()
+        cache_key = self._content_key("html", {"title": title, "markdown": markdown_content})
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Convert Markdown to HTML
+        html_body = _markdown_to_html(markdown_content)
+        
+        # Wrap in HTML template
+        html = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>{_HTML_STYLE}    </style>
 </head>
 <body>
     <div class="container">
@@ -305,6 +453,7 @@ class FormattingTools:
 </body>
 </html>"""
         
+        await cache.set(cache_key, html)
         return html
     
     async def generate_pdf(
@@ -324,60 +473,9 @@ class FormattingTools:
         """
         logger.info(f"Generating PDF report: {title}")
         
-        try:
-            from weasyprint import HTML, CSS
-            
-            # Generate PDF from HTML
-            pdf_bytes = HTML(string=html_content).write_pdf()
-            
-            return pdf_bytes
-            
-        except ImportError:
-            logger.warning("WeasyPrint not available, using fallback PDF generation")
-            
-            # Fallback: Use reportlab for basic PDF
-            from reportlab.lib.pagesizes import letter
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.units import inch
-            
-            buffer = BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=letter)
-            styles = getSampleStyleSheet()
-            
-            # Create custom styles
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                spaceAfter=30
-            )
-            
-            story = []
-            
-            # Add title
-            story.append(Paragraph(title, title_style))
-            story.append(Spacer(1, 12))
-            
-            # Add metadata
-            story.append(Paragraph(
-                f"Generated on {datetime.utcnow().strftime('%B %d, %Y')}",
-                styles['Normal']
-            ))
-            story.append(Spacer(1, 24))
-            
-            # Add content (simplified - strip HTML)
-            clean_text = re.sub(r'<[^>]+>', '', html_content)
-            paragraphs = clean_text.split('\n\n')
-            
-            for para in paragraphs[:50]:  # Limit for basic fallback
-                if para.strip():
-                    story.append(Paragraph(para.strip(), styles['Normal']))
-                    story.append(Spacer(1, 12))
-            
-            doc.build(story)
-            
-            return buffer.getvalue()
+        # Rendering is CPU-bound; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_pdf_pool(), _render_pdf, title, html_content)
     
     async def format_citations(
         self,
@@ -441,21 +539,61 @@ class FormattingTools:
         
         return "\n\n".join(citations)
     
+    @staticmethod
+    def _summary_input(
+        content: Union[str, Iterable[Tuple[str, str]]],
+        budget: int
+    ) -> str:
+        """
+        Report text for the summary prompt, capped at ``budget`` characters.
+
+        ``(title, content)`` pairs are joined only until the budget is
+        reached, so later sections are never copied into a throwaway string.
+        """
+        if isinstance(content, str):
+            return content[:budget]
+        
+        parts: List[str] = []
+        size = 0
+        for title, body in content:
+            if parts:
+                size += 2  # "\n\n" separator
+            part = f"{title}\n{body}"
+            parts.append(part)
+            size += len(part)
+            if size >= budget:
+                break
+        return "\n\n".join(parts)[:budget]
+    
     async def create_summary(
         self,
-        content: str,
+        content: Union[str, Iterable[Tuple[str, str]]],
         max_length: int = 500
     ) -> str:
         """
         Create an executive summary from report content.
         
         Args:
-            content: Full report content
+            content: Full report content, or ``(title, content)`` section
+                pairs consumed lazily up to the prompt budget
             max_length: Maximum summary length in characters
             
         Returns:
             Executive summary string
         """
+        content = self._summary_input(content, 5000)
+        
+        # Same report text → same summary; skip the LLM call on a repeat
+        cache = get_redis()
+        cache_key = self._content_key("summary", {
+            "model": settings.report_generator_model,
+            "content": content,
+            "max_length": max_length,
+        })
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         prompt = f"""Create a concise executive summary of the following research report.
 
 The summary should:
@@ -468,7 +606,7 @@ The summary should:
 7. Include the confidence level of the findings
 
 REPORT CONTENT:
-{content[:5000]}
+{content}
 
 Write the executive summary:"""
         
@@ -484,7 +622,10 @@ Write the executive summary:"""
             if len(summary) > max_length:
                 summary = summary[:max_length-3] + "..."
             
-            return summary.strip()
+            summary = summary.strip()
+            if summary:
+                await cache.set(cache_key, summary)
+            return summary
             
         except Exception as e:
             logger.error(f"Summary generation failed: {e}")
@@ -551,8 +692,7 @@ Respond in JSON format:
                 max_tokens=1000
             )
             
-            import json
-            json_match = re.search(r'\{[\s\S]*\}', result)
+            json_match = _JSON_OBJECT_RE.search(result)
             if json_match:
                 structure = json.loads(json_match.group())
                 
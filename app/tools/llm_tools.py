@@ -4,12 +4,63 @@ LLM Tools for interacting with language models via OpenRouter.
 
 import httpx
 from typing import Optional, Dict, Any, List
+import asyncio
 import json
+import re
+import weakref
 
 from app.config import settings
 from app.utils.logging import logger
 
 
+# Shared HTTP clients, one per event loop.  Every agent's LLMTools talks
+# to the same OpenRouter endpoint, so reusing pooled connections saves a
+# TCP/TLS handshake on each call.  httpx clients are bound to the loop
+# they were created on; entries drop out when their loop is collected.
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared LLM HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(120.0, connect=10.0),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        )
+        _http_clients[loop] = client
+    return client
+
+
+# Providers that honour explicit ``cache_control`` breakpoints through
+# OpenRouter; others (OpenAI, DeepSeek) cache a repeated prefix implicitly.
+_CACHE_CONTROL_PROVIDERS = ("anthropic/", "google/")
+
+_JSON_RE = re.compile(r'[\{\[][\s\S]*[\}\]]')
+
+
+def _user_content(prompt: str, model: str, cached_prefix: Optional[str]) -> Any:
+    """Build user message content with the stable prefix first."""
+    if not cached_prefix:
+        return prompt
+    if model.startswith(_CACHE_CONTROL_PROVIDERS):
+        return [
+            {"type": "text", "text": cached_prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": prompt},
+        ]
+    return f"{cached_prefix}\n\n{prompt}"
+
+
+async def close_http_client():
+    """Close the shared LLM HTTP client for the running event loop."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 class LLMTools:
     """Tools for interacting with LLMs via OpenRouter API."""
     
@@ -25,7 +76,8 @@ class LLMTools:
         system_prompt: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 2000,
-        stop: Optional[List[str]] = None
+        stop: Optional[List[str]] = None,
+        cached_prefix: Optional[str] = None
     ) -> str:
         """
         Generate text using the specified LLM.
@@ -37,6 +89,8 @@ class LLMTools:
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
             stop: Stop sequences
+            cached_prefix: Context shared by several calls, sent ahead of
+                the prompt so the provider can cache it
             
         Returns:
             Generated text
@@ -50,7 +104,7 @@ class LLMTools:
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages.append({"role": "user", "content": _user_content(prompt, model, cached_prefix)})
         
         payload = {
             "model": model,
@@ -70,47 +124,48 @@ class LLMTools:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload
-                )
+            client = get_http_client()
+            response = await client.post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=self.timeout
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                
+                # Safely extract content — guard against None / missing keys
+                choices = data.get("choices")
+                if not choices or not isinstance(choices, list) or len(choices) == 0:
+                    logger.error(f"LLM API returned no choices: {data}")
+                    raise Exception(
+                        f"LLM API returned an empty response (no choices). "
+                        f"Error detail: {data.get('error', 'unknown')}"
+                    )
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Safely extract content — guard against None / missing keys
-                    choices = data.get("choices")
-                    if not choices or not isinstance(choices, list) or len(choices) == 0:
-                        logger.error(f"LLM API returned no choices: {data}")
-                        raise Exception(
-                            f"LLM API returned an empty response (no choices). "
-                            f"Error detail: {data.get('error', 'unknown')}"
-                        )
-                    
-                    message = choices[0].get("message") or {}
-                    content = message.get("content")
-                    if content is None:
-                        logger.error(f"LLM API returned null content: {choices[0]}")
-                        raise Exception(
-                            "LLM API returned null content in the response."
-                        )
-                    
-                    # Log token usage
-                    usage = data.get("usage", {})
-                    logger.debug(
-                        f"LLM call - Model: {model}, "
-                        f"Input: {usage.get('prompt_tokens', 0)}, "
-                        f"Output: {usage.get('completion_tokens', 0)}"
+                message = choices[0].get("message") or {}
+                content = message.get("content")
+                if content is None:
+                    logger.error(f"LLM API returned null content: {choices[0]}")
+                    raise Exception(
+                        "LLM API returned null content in the response."
                     )
-                    
-                    return content
-                else:
-                    error_text = response.text
-                    logger.error(f"LLM API error: {response.status_code} - {error_text}")
-                    raise Exception(f"LLM API error ({response.status_code}): {error_text[:200]}")
-                    
+                
+                # Log token usage
+                usage = data.get("usage", {})
+                logger.debug(
+                    f"LLM call - Model: {model}, "
+                    f"Input: {usage.get('prompt_tokens', 0)}, "
+                    f"Output: {usage.get('completion_tokens', 0)}"
+                )
+                
+                return content
+            else:
+                error_text = response.text
+                logger.error(f"LLM API error: {response.status_code} - {error_text}")
+                raise Exception(f"LLM API error ({response.status_code}): {error_text[:200]}")
+                
         except httpx.TimeoutException:
             logger.error("LLM request timed out")
             raise
@@ -164,38 +219,39 @@ class LLMTools:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload
-                )
+            client = get_http_client()
+            response = await client.post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=self.timeout
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                
+                choices = data.get("choices")
+                if not choices or not isinstance(choices, list) or len(choices) == 0:
+                    logger.error(f"LLM function call returned no choices: {data}")
+                    raise Exception(
+                        f"LLM API returned an empty response (no choices). "
+                        f"Error detail: {data.get('error', 'unknown')}"
+                    )
+                
+                choice = choices[0]
+                message = choice.get("message") or {}
+                
+                result = {
+                    "content": message.get("content"),
+                    "tool_calls": message.get("tool_calls"),
+                    "usage": data.get("usage", {})
+                }
+                
+                return result
+            else:
+                logger.error(f"LLM API error: {response.status_code} - {response.text[:200]}")
+                raise Exception(f"LLM API error ({response.status_code}): {response.text[:200]}")
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    choices = data.get("choices")
-                    if not choices or not isinstance(choices, list) or len(choices) == 0:
-                        logger.error(f"LLM function call returned no choices: {data}")
-                        raise Exception(
-                            f"LLM API returned an empty response (no choices). "
-                            f"Error detail: {data.get('error', 'unknown')}"
-                        )
-                    
-                    choice = choices[0]
-                    message = choice.get("message") or {}
-                    
-                    result = {
-                        "content": message.get("content"),
-                        "tool_calls": message.get("tool_calls"),
-                        "usage": data.get("usage", {})
-                    }
-                    
-                    return result
-                else:
-                    logger.error(f"LLM API error: {response.status_code} - {response.text[:200]}")
-                    raise Exception(f"LLM API error ({response.status_code}): {response.text[:200]}")
-                    
         except Exception as e:
             logger.error(f"LLM function call failed: {e}")
             raise
@@ -237,8 +293,7 @@ Return ONLY valid JSON, no other text."""
         # Try to parse JSON
         try:
             # Find JSON in response
-            import re
-            json_match = re.search(r'[\{\[][\s\S]*[\}\]]', result)
+            json_match = _JSON_RE.search(result)
             if json_match:
                 return json.loads(json_match.group())
         except json.JSONDecodeError:
@@ -7,6 +7,7 @@ API calls, and store results on cache miss.
 """
 
 import asyncio
+import weakref
 import httpx
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
@@ -21,6 +22,35 @@ from app.utils.logging import logger
 from app.services.redis_cache import get_redis
 
 
+# Shared HTTP clients, one per event loop.  Every query fans out to the
+# same few search APIs, so pooled keep-alive connections save a TCP/TLS
+# handshake (and DNS lookup) per request.  Mirrors the LLM client in
+# ``llm_tools``.
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_search_client() -> httpx.AsyncClient:
+    """Get the shared search HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        )
+        _http_clients[loop] = client
+    return client
+
+
+async def close_search_client():
+    """Close the shared search HTTP client for the running event loop."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 class SearchTools:
     """Collection of search tools for gathering information from multiple sources."""
     
@@ -28,7 +58,6 @@ class SearchTools:
     CACHE_TTL = 86400
 
     def __init__(self):
-        self.timeout = httpx.Timeout(30.0, connect=10.0)
         self.headers = {
             "User-Agent": "Multi-Agent-Research-Assistant/1.0"
         }
@@ -147,55 +176,55 @@ class SearchTools:
         results = []
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                params = {
-                    "api_key": settings.serpapi_key,
-                    "engine": "google",
-                    "q": query,
-                    "num": min(num_results, 100),
-                    "hl": "en",
-                    "gl": "us"
-                }
+            client = get_search_client()
+            params = {
+                "api_key": settings.serpapi_key,
+                "engine": "google",
+                "q": query,
+                "num": min(num_results, 100),
+                "hl": "en",
+                "gl": "us"
+            }
+            
+            response = await client.get(
+                "https://serpapi.com/search",
+                params=params
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
                 
-                response = await client.get(
-                    "https://serpapi.com/search",
-                    params=params
-                )
+                # Get organic results
+                organic_results = data.get("organic_results", [])
+                
+                for item in organic_results[:num_results]:
+                    results.append({
+                        "title": item.get("title", ""),
+                        "url": item.get("link", ""),
+                        "snippet": item.get("snippet", ""),
+                        "displayed_link": item.get("displayed_link", ""),
+                        "source_type": "web",
+                        "api_source": "serpapi",
+                        "retrieved_at": datetime.utcnow().isoformat()
+                    })
+                
+                # Also include knowledge graph if available
+                knowledge_graph = data.get("knowledge_graph", {})
+                if knowledge_graph:
+                    kg_result = {
+                        "title": knowledge_graph.get("title", "Knowledge Graph Result"),
+                        "url": knowledge_graph.get("website", knowledge_graph.get("source", {}).get("link", "")),
+                        "snippet": knowledge_graph.get("description", ""),
+                        "source_type": "knowledge_graph",
+                        "api_source": "serpapi",
+                        "retrieved_at": datetime.utcnow().isoformat()
+                    }
+                    if kg_result["url"]:
+                        results.insert(0, kg_result)
+                
+            else:
+                logger.error(f"SerpAPI search error: {response.status_code} - {response.text}")
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Get organic results
-                    organic_results = data.get("organic_results", [])
-                    
-                    for item in organic_results[:num_results]:
-                        results.append({
-                            "title": item.get("title", ""),
-                            "url": item.get("link", ""),
-                            "snippet": item.get("snippet", ""),
-                            "displayed_link": item.get("displayed_link", ""),
-                            "source_type": "web",
-                            "api_source": "serpapi",
-                            "retrieved_at": datetime.utcnow().isoformat()
-                        })
-                    
-                    # Also include knowledge graph if available
-                    knowledge_graph = data.get("knowledge_graph", {})
-                    if knowledge_graph:
-                        kg_result = {
-                            "title": knowledge_graph.get("title", "Knowledge Graph Result"),
-                            "url": knowledge_graph.get("website", knowledge_graph.get("source", {}).get("link", "")),
-                            "snippet": knowledge_graph.get("description", ""),
-                            "source_type": "knowledge_graph",
-                            "api_source": "serpapi",
-                            "retrieved_at": datetime.utcnow().isoformat()
-                        }
-                        if kg_result["url"]:
-                            results.insert(0, kg_result)
-                    
-                else:
-                    logger.error(f"SerpAPI search error: {response.status_code} - {response.text}")
-                    
             logger.info(f"SerpAPI search returned {len(results)} results")
             
         except Exception as e:
@@ -230,42 +259,42 @@ class SearchTools:
         results = []
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Google allows max 10 results per request
-                for start in range(1, min(num_results + 1, 101), 10):
-                    params = {
-                        "key": settings.google_api_key,
-                        "cx": settings.google_search_engine_id,
-                        "q": query,
-                        "start": start,
-                        "num": min(10, num_results - len(results))
-                    }
+            client = get_search_client()
+            # Google allows max 10 results per request
+            for start in range(1, min(num_results + 1, 101), 10):
+                params = {
+                    "key": settings.google_api_key,
+                    "cx": settings.google_search_engine_id,
+                    "q": query,
+                    "start": start,
+                    "num": min(10, num_results - len(results))
+                }
+                
+                response = await client.get(
+                    "https://www.googleapis.com/customsearch/v1",
+                    params=params
+                )
+                
+                if response.status_code == 200:
+                    data = response.json()
+                    items = data.get("items", [])
+                    
+                    for item in items:
+                        results.append({
+                            "title": item.get("title", ""),
+                            "url": item.get("link", ""),
+                            "snippet": item.get("snippet", ""),
+                            "source_type": "web",
+                            "api_source": "google",
+                            "retrieved_at": datetime.utcnow().isoformat()
+                        })
+                else:
+                    logger.error(f"Google search error: {response.status_code}")
+                    break
                     
-                    response = await client.get(
-                        "https://www.googleapis.com/customsearch/v1",
-                        params=params
-                    )
+                if len(results) >= num_results:
+                    break
                     
-                    if response.status_code == 200:
-                        data = response.json()
-                        items = data.get("items", [])
-                        
-                        for item in items:
-                            results.append({
-                                "title": item.get("title", ""),
-                                "url": item.get("link", ""),
-                                "snippet": item.get("snippet", ""),
-                                "source_type": "web",
-                                "api_source": "google",
-                                "retrieved_at": datetime.utcnow().isoformat()
-                            })
-                    else:
-                        logger.error(f"Google search error: {response.status_code}")
-                        break
-                        
-                    if len(results) >= num_results:
-                        break
-                        
             logger.info(f"Google search returned {len(results)} results")
             
         except Exception as e:
@@ -305,41 +334,41 @@ class SearchTools:
             # Limit to last 30 days to avoid stale/irrelevant results
             from_date = (datetime.utcnow() - timedelta(days=30)).strftime('%Y-%m-%d')
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                params = {
-                    "q": query,
-                    "language": language,
-                    "sortBy": sort_by,
-                    "pageSize": min(num_results, 100),
-                    "from": from_date,
-                    "apiKey": settings.newsapi_key
-                }
+            client = get_search_client()
+            params = {
+                "q": query,
+                "language": language,
+                "sortBy": sort_by,
+                "pageSize": min(num_results, 100),
+                "from": from_date,
+                "apiKey": settings.newsapi_key
+            }
+            
+            response = await client.get(
+                "https://newsapi.org/v2/everything",
+                params=params
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                articles = data.get("articles", [])
                 
-                response = await client.get(
-                    "https://newsapi.org/v2/everything",
-                    params=params
-                )
+                for article in articles:
+                    results.append({
+                        "title": article.get("title", ""),
+                        "url": article.get("url", ""),
+                        "snippet": article.get("description", ""),
+                        "content": article.get("content", ""),
+                        "author": article.get("author"),
+                        "source_name": article.get("source", {}).get("name"),
+                        "published_at": article.get("publishedAt"),
+                        "source_type": "news",
+                        "api_source": "newsapi",
+                        "retrieved_at": datetime.utcnow().isoformat()
+                    })
+            else:
+                logger.error(f"NewsAPI error: {response.status_code} - {response.text}")
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    articles = data.get("articles", [])
-                    
-                    for article in articles:
-                        results.append({
-                            "title": article.get("title", ""),
-                            "url": article.get("url", ""),
-                            "snippet": article.get("description", ""),
-                            "content": article.get("content", ""),
-                            "author": article.get("author"),
-                            "source_name": article.get("source", {}).get("name"),
-                            "published_at": article.get("publishedAt"),
-                            "source_type": "news",
-                            "api_source": "newsapi",
-                            "retrieved_at": datetime.utcnow().isoformat()
-                        })
-                else:
-                    logger.error(f"NewsAPI error: {response.status_code} - {response.text}")
-                    
             logger.info(f"NewsAPI returned {len(results)} results")
             
         except Exception as e:
@@ -373,41 +402,41 @@ class SearchTools:
             search_query = quote_plus(query)
             url = f"{settings.arxiv_api_base}?search_query=all:{search_query}&start=0&max_results={max_results}"
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers)
+            client = get_search_client()
+            response = await client.get(url, headers=self.headers)
+            
+            if response.status_code == 200:
+                # Parse Atom feed
+                feed = feedparser.parse(response.text)
                 
-                if response.status_code == 200:
-                    # Parse Atom feed
-                    feed = feedparser.parse(response.text)
+                for entry in feed.entries:
+                    # Extract authors
+                    authors = [author.get("name", "") for author in entry.get("authors", [])]
                     
-                    for entry in feed.entries:
-                        # Extract authors
-                        authors = [author.get("name", "") for author in entry.get("authors", [])]
-                        
-                        # Get PDF link
-                        pdf_link = ""
-                        for link in entry.get("links", []):
-                            if link.get("type") == "application/pdf":
-                                pdf_link = link.get("href", "")
-                                break
-                        
-                        results.append({
-                            "title": entry.get("title", "").replace("\n", " "),
-                            "url": entry.get("link", ""),
-                            "pdf_url": pdf_link,
-                            "snippet": entry.get("summary", "").replace("\n", " ")[:500],
-                            "authors": authors,
-                            "published_at": entry.get("published"),
-                            "updated_at": entry.get("updated"),
-                            "categories": [tag.get("term") for tag in entry.get("tags", [])],
-                            "arxiv_id": entry.get("id", "").split("/abs/")[-1],
-                            "source_type": "academic",
-                            "api_source": "arxiv",
-                            "retrieved_at": datetime.utcnow().isoformat()
-                        })
-                else:
-                    logger.error(f"ArXiv search error: {response.status_code}")
+                    # Get PDF link
+                    pdf_link = ""
+                    for link in entry.get("links", []):
+                        if link.get("type") == "application/pdf":
+                            pdf_link = link.get("href", "")
+                            break
                     
+                    results.append({
+                        "title": entry.get("title", "").replace("\n", " "),
+                        "url": entry.get("link", ""),
+                        "pdf_url": pdf_link,
+                        "snippet": entry.get("summary", "").replace("\n", " ")[:500],
+                        "authors": authors,
+                        "published_at": entry.get("published"),
+                        "updated_at": entry.get("updated"),
+                        "categories": [tag.get("term") for tag in entry.get("tags", [])],
+                        "arxiv_id": entry.get("id", "").split("/abs/")[-1],
+                        "source_type": "academic",
+                        "api_source": "arxiv",
+                        "retrieved_at": datetime.utcnow().isoformat()
+                    })
+            else:
+                logger.error(f"ArXiv search error: {response.status_code}")
+                
             logger.info(f"ArXiv search returned {len(results)} results")
             
         except Exception as e:
@@ -438,97 +467,97 @@ class SearchTools:
         results = []
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Step 1: Search for IDs
-                search_params = {
-                    "db": "pubmed",
-                    "term": query,
-                    "retmax": max_results,
-                    "retmode": "json",
-                    "sort": "relevance"
-                }
-                
-                search_response = await client.get(
-                    f"{settings.pubmed_api_base}/esearch.fcgi",
-                    params=search_params
-                )
-                
-                if search_response.status_code != 200:
-                    logger.error(f"PubMed search error: {search_response.status_code}")
-                    return results
-                
-                search_data = search_response.json()
-                id_list = search_data.get("esearchresult", {}).get("idlist", [])
-                
-                if not id_list:
-                    return results
-                
-                # Step 2: Fetch details for each ID
-                fetch_params = {
-                    "db": "pubmed",
-                    "id": ",".join(id_list),
-                    "retmode": "xml"
-                }
-                
-                fetch_response = await client.get(
-                    f"{settings.pubmed_api_base}/efetch.fcgi",
-                    params=fetch_params
-                )
+            client = get_search_client()
+            # Step 1: Search for IDs
+            search_params = {
+                "db": "pubmed",
+                "term": query,
+                "retmax": max_results,
+                "retmode": "json",
+                "sort": "relevance"
+            }
+            
+            search_response = await client.get(
+                f"{settings.pubmed_api_base}/esearch.fcgi",
+                params=search_params
+            )
+            
+            if search_response.status_code != 200:
+                logger.error(f"PubMed search error: {search_response.status_code}")
+                return results
+            
+            search_data = search_response.json()
+            id_list = search_data.get("esearchresult", {}).get("idlist", [])
+            
+            if not id_list:
+                return results
+            
+            # Step 2: Fetch details for each ID
+            fetch_params = {
+                "db": "pubmed",
+                "id": ",".join(id_list),
+                "retmode": "xml"
+            }
+            
+            fetch_response = await client.get(
+                f"{settings.pubmed_api_base}/efetch.fcgi",
+                params=fetch_params
+            )
+            
+            if fetch_response.status_code == 200:
+                # Parse XML response
+                root = ET.fromstring(fetch_response.text)
                 
-                if fetch_response.status_code == 200:
-                    # Parse XML response
-                    root = ET.fromstring(fetch_response.text)
-                    
-                    for article in root.findall(".//PubmedArticle"):
-                        try:
-                            medline = article.find(".//MedlineCitation")
-                            article_data = medline.find(".//Article") if medline is not None else None
-                            
-                            if article_data is None:
-                                continue
-                            
-                            # Extract title
-                            title_elem = article_data.find(".//ArticleTitle")
-                            title = title_elem.text if title_elem is not None else ""
-                            
-                            # Extract abstract
-                            abstract_elem = article_data.find(".//Abstract/AbstractText")
-                            abstract = abstract_elem.text if abstract_elem is not None else ""
-                            
-                            # Extract authors
-                            authors = []
-                            for author in article_data.findall(".//Author"):
-                                last_name = author.find("LastName")
-                                first_name = author.find("ForeName")
-                                if last_name is not None:
-                                    name = last_name.text
-                                    if first_name is not None:
-                                        name = f"{first_name.text} {name}"
-                                    authors.append(name)
-                            
-                            # Extract PMID
-                            pmid_elem = medline.find(".//PMID")
-                            pmid = pmid_elem.text if pmid_elem is not None else ""
-                            
-                            # Extract publication date
-                            pub_date = article_data.find(".//PubDate")
-                            year = pub_date.find("Year").text if pub_date is not None and pub_date.find("Year") is not None else ""
-                            
-                            results.append({
-                                "title": title,
-                                "url": f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
-                                "snippet": abstract[:500] if abstract else "",
-                                "authors": authors,
-                                "pmid": pmid,
-                                "published_at": year,
-                                "source_type": "academic",
-                                "api_source": "pubmed",
-                                "retrieved_at": datetime.utcnow().isoformat()
-                            })
-                        except Exception as e:
-                            logger.warning(f"Error parsing PubMed article: {e}")
+                for article in root.findall(".//PubmedArticle"):
+                    try:
+                        medline = article.find(".//MedlineCitation")
+                        article_data = medline.find(".//Article") if medline is not None else None
+                        
+                        if article_data is None:
                             continue
-                            
+                        
+                        # Extract title
+                        title_elem = article_data.find(".//ArticleTitle")
+                        title = title_elem.text if title_elem is not None else ""
+                        
+                        # Extract abstract
+                        abstract_elem = article_data.find(".//Abstract/AbstractText")
+                        abstract = abstract_elem.text if abstract_elem is not None else ""
+                        
+                        # Extract authors
+                        authors = []
+                        for author in article_data.findall(".//Author"):
+                            last_name = author.find("LastName")
+                            first_name = author.find("ForeName")
+                            if last_name is not None:
+                                name = last_name.text
+                                if first_name is not None:
+                                    name = f"{first_name.text} {name}"
+                                authors.append(name)
+                        
+                        # Extract PMID
+                        pmid_elem = medline.find(".//PMID")
+                        pmid = pmid_elem.text if pmid_elem is not None else ""
+                        
+                        # Extract publication date
+                        pub_date = article_data.find(".//PubDate")
+                        year = pub_date.find("Year").text if pub_date is not None and pub_date.find("Year") is not None else ""
+                        
+                        results.append({
+                            "title": title,
+                            "url": f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
+                            "snippet": abstract[:500] if abstract else "",
+                            "authors": authors,
+                            "pmid": pmid,
+                            "published_at": year,
+                            "source_type": "academic",
+                            "api_source": "pubmed",
+                            "retrieved_at": datetime.utcnow().isoformat()
+                        })
+                    except Exception as e:
+                        logger.warning(f"Error parsing PubMed article: {e}")
+                        continue
+                        
             logger.info(f"PubMed search returned {len(results)} results")
             
         except Exception as e:
@@ -559,49 +588,49 @@ class SearchTools:
         results = []
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Search for pages
-                search_params = {
-                    "action": "query",
-                    "list": "search",
-                    "srsearch": query,
-                    "srlimit": num_results,
-                    "format": "json"
-                }
+            client = get_search_client()
+            # Search for pages
+            search_params = {
+                "action": "query",
+                "list": "search",
+                "srsearch": query,
+                "srlimit": num_results,
+                "format": "json"
+            }
+            
+            search_response = await client.get(
+                "https://en.wikipedia.org/w/api.php",
+                params=search_params
+            )
+            
+            if search_response.status_code != 200:
+                return results
+            
+            search_data = search_response.json()
+            pages = search_data.get("query", {}).get("search", [])
+            
+            # Get summaries for each page
+            for page in pages:
+                title = page.get("title", "")
                 
-                search_response = await client.get(
-                    "https://en.wikipedia.org/w/api.php",
-                    params=search_params
+                # Get page summary
+                summary_response = await client.get(
+                    f"{settings.wikipedia_api_base}/page/summary/{quote_plus(title)}"
                 )
                 
-                if search_response.status_code != 200:
-                    return results
-                
-                search_data = search_response.json()
-                pages = search_data.get("query", {}).get("search", [])
-                
-                # Get summaries for each page
-                for page in pages:
-                    title = page.get("title", "")
+                if summary_response.status_code == 200:
+                    summary_data = summary_response.json()
                     
-                    # Get page summary
-                    summary_response = await client.get(
-                        f"{settings.wikipedia_api_base}/page/summary/{quote_plus(title)}"
-                    )
+                    results.append({
+                        "title": summary_data.get("title", title),
+                        "url": summary_data.get("content_urls", {}).get("desktop", {}).get("page", ""),
+                        "snippet": summary_data.get("extract", ""),
+                        "description": summary_data.get("description", ""),
+                        "source_type": "wikipedia",
+                        "api_source": "wikipedia",
+                        "retrieved_at": datetime.utcnow().isoformat()
+                    })
                     
-                    if summary_response.status_code == 200:
-                        summary_data = summary_response.json()
-                        
-                        results.append({
-                            "title": summary_data.get("title", title),
-                            "url": summary_data.get("content_urls", {}).get("desktop", {}).get("page", ""),
-                            "snippet": summary_data.get("extract", ""),
-                            "description": summary_data.get("description", ""),
-                            "source_type": "wikipedia",
-                            "api_source": "wikipedia",
-                            "retrieved_at": datetime.utcnow().isoformat()
-                        })
-                        
             logger.info(f"Wikipedia search returned {len(results)} results")
             
         except Exception as e:
@@ -626,23 +655,23 @@ class SearchTools:
         try:
             from bs4 import BeautifulSoup
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers, follow_redirects=True)
+            client = get_search_client()
+            response = await client.get(url, headers=self.headers, follow_redirects=True)
+            
+            if response.status_code == 200:
+                soup = BeautifulSoup(response.text, 'lxml')
+                
+                # Remove script and style elements
+                for script in soup(["script", "style", "nav", "footer", "header"]):
+                    script.decompose()
+                
+                # Get text
+                text = soup.get_text(separator='\n', strip=True)
+                
+                # Clean up whitespace
+                lines = [line.strip() for line in text.splitlines() if line.strip()]
+                return '\n'.join(lines)
                 
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'lxml')
-                    
-                    # Remove script and style elements
-                    for script in soup(["script", "style", "nav", "footer", "header"]):
-                        script.decompose()
-                    
-                    # Get text
-                    text = soup.get_text(separator='\n', strip=True)
-                    
-                    # Clean up whitespace
-                    lines = [line.strip() for line in text.splitlines() if line.strip()]
-                    return '\n'.join(lines)
-                    
         except Exception as e:
             logger.error(f"Failed to fetch content from {url}: {e}")
             
@@ -5,6 +5,7 @@ Provides fact-checking, source credibility, and bias detection.
 
 import asyncio
 import httpx
+import json
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from urllib.parse import urlparse
@@ -15,6 +16,9 @@ from app.utils.logging import logger
 from app.tools.llm_tools import LLMTools
 
 
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+
+
 class ValidationTools:
     """Collection of validation tools for fact-checking and verification."""
     
@@ -127,9 +131,8 @@ Respond in JSON format:
             )
             
             # Parse JSON response
-            import json
             # Extract JSON from response
-            json_match = re.search(r'\{[\s\S]*\}', result)
+            json_match = _JSON_OBJECT_RE.search(result)
             if json_match:
                 analysis = json.loads(json_match.group())
                 
@@ -323,8 +326,7 @@ Respond in JSON:
                 max_tokens=1000
             )
             
-            import json
-            json_match = re.search(r'\{[\s\S]*\}', result)
+            json_match = _JSON_OBJECT_RE.search(result)
             if json_match:
                 analysis = json.loads(json_match.group())
                 return {
@@ -394,8 +396,7 @@ Respond in JSON:
                 max_tokens=800
             )
             
-            import json
-            json_match = re.search(r'\{[\s\S]*\}', result)
+            json_match = _JSON_OBJECT_RE.search(result)
             if json_match:
                 analysis = json.loads(json_match.group())
                 return {
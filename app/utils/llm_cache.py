@@ -0,0 +1,93 @@
+"""
+LLM response cache.
+
+Agent prompts are fully determined by the research inputs, so a repeated
+query re-sends identical prompts.  ``cached_think`` keys the response on
+the model, sampling temperature, system prompt and prompt text, and serves
+it from Redis on a hit instead of calling the LLM again.
+
+Callers whose output depends only on the research query (e.g. the report
+title) can key on ``normalize_query(query)`` instead, so variants such as
+"The impact of AI?" / "impact of AI" share one entry.
+
+Agents sampling above ``_MAX_CACHEABLE_TEMPERATURE`` are meant to vary
+between runs and always reach the LLM.
+"""
+
+import hashlib
+import re
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from app.config import settings
+from app.services.redis_cache import get_redis
+
+if TYPE_CHECKING:
+    from app.agents.base_agent import BaseAgent
+
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+# Question words (how, why, what, ...) are kept: they change the question
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "does", "for", "from",
+    "in", "is", "it", "of", "on", "or", "s", "the", "to", "with",
+})
+
+_MAX_CACHEABLE_TEMPERATURE = 0.5
+
+# Process-wide hit/miss counters, reported by ``cache_stats``
+_stats = {"hits": 0, "misses": 0}
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Hit/miss counts and hit rate of the LLM response cache."""
+    lookups = _stats["hits"] + _stats["misses"]
+    return {**_stats, "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else 0.0}
+
+
+def normalize_query(query: str) -> str:
+    """
+    Case-, punctuation- and stopword-insensitive form of a query for cache
+    keys.  Word order is kept: "men bite dogs" is not "dogs bite men".
+    """
+    return " ".join(w for w in _WORD_RE.findall(query.lower()) if w not in _STOPWORDS)
+
+
+def _prompt_key(agent: "BaseAgent", prompt: str) -> str:
+    """Deterministic cache key for an agent prompt."""
+    h = hashlib.sha256(
+        f"{agent.model}|{agent.temperature}|{agent.system_prompt}|{prompt}".encode()
+    ).hexdigest()
+    return f"rc:llm:{h}"
+
+
+async def cached_think(
+    agent: "BaseAgent",
+    prompt: str,
+    key_text: Optional[str] = None,
+    cached_prefix: Optional[str] = None
+) -> str:
+    """
+    ``agent.think(prompt)`` backed by the response cache.
+
+    ``key_text`` replaces the prompt in the cache key when the caller
+    knows a smaller input fully determines the answer.  ``cached_prefix``
+    is forwarded to ``think`` and is part of the default key.
+    """
+    if agent.temperature > _MAX_CACHEABLE_TEMPERATURE:
+        return await agent.think(prompt, cached_prefix=cached_prefix)
+    
+    cache = get_redis()
+    if key_text is None:
+        key_text = f"{cached_prefix}|{prompt}" if cached_prefix else prompt
+    key = _prompt_key(agent, key_text)
+
+    cached = await cache.get(key)
+    if cached is not None:
+        _stats["hits"] += 1
+        return cached
+    _stats["misses"] += 1
+
+    response = await agent.think(prompt, cached_prefix=cached_prefix)
+    if response:
+        await cache.set(key, response, settings.cache_ttl)
+    return response
@@ -56,6 +56,17 @@ class TestAgentBase:
         assert "progress" in state
         assert state["status"] == "idle"
 
+    async def test_cached_prefix_leads_user_message(self):
+        """Test shared context is sent first, with a cache breakpoint where supported."""
+        from app.tools.llm_tools import _user_content
+
+        parts = _user_content("tail", "anthropic/claude-3.5-sonnet", "prefix")
+        assert parts[0] == {"type": "text", "text": "prefix", "cache_control": {"type": "ephemeral"}}
+        assert parts[1] == {"type": "text", "text": "tail"}
+
+        assert _user_content("tail", "deepseek/deepseek-chat", "prefix") == "prefix\n\ntail"
+        assert _user_content("tail", "deepseek/deepseek-chat", None) == "tail"
+
 
 class TestResearcher:
     """Test Researcher agent."""
@@ -69,6 +80,151 @@ class TestResearcher:
         assert researcher.name == "Researcher"
         assert researcher.search_tools is not None
 
+    def test_canonical_url_collapses_tracking_variants(self):
+        """Test URL variants differing only in scheme, case, www, slash, fragment or tracking share a key."""
+        from app.agents.researcher import _canonical_url
+
+        key = _canonical_url("https://example.com/post?id=3")
+        assert _canonical_url("HTTPS://Example.com/post/?utm_source=x&id=3#top") == key
+        assert _canonical_url("http://www.example.com/post?id=3&fbclid=abc") == key
+        assert _canonical_url("https://example.com/post?id=4") != key
+
+    async def test_strong_keyword_matches_skip_llm_filter(self):
+        """Test sources matching most query keywords skip the LLM call."""
+        from app.agents.researcher import ResearcherAgent
+
+        researcher = ResearcherAgent()
+        researcher.think = AsyncMock(return_value="0")
+        strong = [{"title": f"Solar panel efficiency {i}", "url": f"https://s{i}.example"} for i in range(25)]
+        weak = [{"title": "Solar news", "url": "https://w.example"}, {"title": "Unrelated", "url": "https://u.example"}]
+
+        with patch("app.utils.llm_cache.get_redis", return_value=Mock(get=AsyncMock(return_value=None), set=AsyncMock())):
+            relevant = await researcher._filter_relevant_sources("solar panel efficiency", strong + weak)
+
+        researcher.think.assert_awaited_once()
+        prompt = researcher.think.await_args.args[0]
+        assert "Solar news" in prompt and "Unrelated" in prompt and "Solar panel" not in prompt
+        assert len(relevant) == 26
+
+    async def test_inflected_keyword_source_reaches_llm_filter(self):
+        """Test a source missing the exact query word is judged by the LLM, not dropped."""
+        from app.agents.researcher import ResearcherAgent
+
+        researcher = ResearcherAgent()
+        researcher.think = AsyncMock(return_value="0")
+        exact = [{"title": f"Vaccines trial {i}", "url": f"https://v{i}.example"} for i in range(24)]
+        inflected = {"title": "Vaccine effect study", "url": "https://i.example"}
+
+        with patch("app.utils.llm_cache.get_redis", return_value=Mock(get=AsyncMock(return_value=None), set=AsyncMock())):
+            relevant = await researcher._filter_relevant_sources("vaccines", exact + [inflected])
+
+        assert "Vaccine effect study" in researcher.think.await_args.args[0]
+        assert inflected in relevant
+
+    async def test_small_source_set_skips_llm_filter(self):
+        """Test a handful of sources is ranked by keywords alone."""
+        from app.agents.researcher import ResearcherAgent
+
+        researcher = ResearcherAgent()
+        researcher.think = AsyncMock()
+        sources = [
+            {"title": "Unrelated", "url": "https://w.example"},
+            {"title": "Solar panel efficiency", "url": "https://s.example"},
+        ]
+
+        relevant = await researcher._filter_relevant_sources("solar panel efficiency", sources)
+
+        researcher.think.assert_not_awaited()
+        assert [s["url"] for s in relevant] == ["https://s.example", "https://w.example"]
+        assert "_relevance_score" not in relevant[0]
+
+    def test_pack_batches_respects_budget_and_cap(self):
+        """Test batches split on the character budget and the item cap."""
+        from app.agents.researcher import _pack_batches
+
+        long_sources = [{"title": "t", "snippet": "x" * 500}] * 5
+        short_sources = [{"title": "t", "snippet": "x"}] * 5
+
+        assert _pack_batches(long_sources, 200, 450, 10) == [(0, 2), (2, 4), (4, 5)]
+        assert _pack_batches(short_sources, 200, 450, 3) == [(0, 3), (3, 5)]
+        assert _pack_batches([], 200, 450, 3) == []
+
+    async def test_ranking_keeps_search_order_among_ties(self):
+        """Test sources tied at the top-150 cutoff are taken in search order."""
+        from app.agents.researcher import ResearcherAgent
+
+        researcher = ResearcherAgent()
+        researcher.think = AsyncMock(return_value="NONE")
+        sources = [{"title": f"Unrelated {i}", "url": f"https://u{i}.example"} for i in range(200)]
+
+        with patch("app.utils.llm_cache.get_redis", return_value=Mock(get=AsyncMock(return_value=None), set=AsyncMock())):
+            relevant = await researcher._filter_relevant_sources("solar panel efficiency", sources)
+
+        assert [s["url"] for s in relevant] == [f"https://u{i}.example" for i in range(50)]
+
+    async def test_filter_batches_fit_prompt_budget(self):
+        """Test 60 long-snippet candidates are split across prompts within the budget."""
+        from app.agents.researcher import ResearcherAgent, _FILTER_BATCH_CHARS
+
+        researcher = ResearcherAgent()
+        researcher.think = AsyncMock(return_value="NONE")
+        sources = [
+            {"title": f"Solar report {i}", "snippet": "x" * 500, "url": f"https://s{i}.example"}
+            for i in range(60)
+        ]
+
+        with patch("app.utils.llm_cache.get_redis", return_value=Mock(get=AsyncMock(return_value=None), set=AsyncMock())):
+            await researcher._filter_relevant_sources("solar panel efficiency", sources)
+
+        prompts = [call.args[0] for call in researcher.think.await_args_list]
+        assert len(prompts) == 3
+        assert sum(p.count("Solar report") for p in prompts) == 60
+        # Each source costs its ~15-char title plus a 200-char snippet
+        assert all(p.count("Solar report") * 214 <= _FILTER_BATCH_CHARS for p in prompts)
+
+    def test_near_duplicate_findings_collapse_locally(self):
+        """Test reworded duplicates merge into the longer finding with both sources."""
+        from app.agents.researcher import ResearcherAgent
+
+        findings = [
+            {"content": "Solar capacity grew 20% in 2023", "resolved_sources": [{"url": "a"}]},
+            {"content": "Solar capacity grew 20% in 2023 worldwide", "resolved_sources": [{"url": "b"}]},
+            {"content": "Wind output fell in Europe", "resolved_sources": [{"url": "c"}]},
+        ]
+
+        kept = ResearcherAgent._collapse_near_duplicates(findings)
+
+        assert [f["content"] for f in kept] == [
+            "Solar capacity grew 20% in 2023 worldwide", "Wind output fell in Europe"
+        ]
+        assert [s["url"] for s in kept[0]["resolved_sources"]] == ["b", "a"]
+
+    async def test_search_queries_run_concurrently(self):
+        """Test all search queries are in flight at once and failures are skipped."""
+        from app.agents.researcher import ResearcherAgent
+
+        researcher = ResearcherAgent()
+        researcher._generate_search_queries = AsyncMock(return_value=["q", "b", "c"])
+        researcher._filter_relevant_sources = AsyncMock(side_effect=lambda q, s: s)
+        researcher._extract_key_info = AsyncMock(return_value=[])
+        in_flight = peak = 0
+
+        async def search_all(query, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if query == "b":
+                raise RuntimeError("boom")
+            return {"google": [{"url": f"https://{query}.example", "api_source": "google"}]}
+
+        researcher.search_tools.search_all = search_all
+        result = await researcher.execute({"query": "q", "max_sources": 10})
+
+        assert peak == 3
+        assert [s["url"] for s in result["sources"]] == ["https://q.example", "https://c.example"]
+
 
 class TestAnalyst:
     """Test Analyst agent."""
@@ -107,6 +263,212 @@ class TestReportGenerator:
         assert generator.name == "Report Generator"
         assert generator.formatting_tools is not None
 
+    async def test_identical_inputs_reuse_cached_report(self):
+        """Test a cached report is returned without running the writing steps."""
+        from app.agents.report_generator import ReportGeneratorAgent
+
+        generator = ReportGeneratorAgent()
+        generator._write_sections = AsyncMock()
+        cached = {"title": "Cached", "html_content": "<p></p>", "quality_score": 3.0}
+        cache = Mock(get=AsyncMock(return_value=cached), set=AsyncMock())
+
+        with patch("app.agents.report_generator.get_redis", return_value=cache):
+            result = await generator.execute({"query": "q", "validated_findings": [{"content": "f"}]})
+
+        assert result["status"] == "completed"
+        assert result["report"]["title"] == "Cached"
+        assert result["report"]["pdf_bytes"] is None
+        generator._write_sections.assert_not_awaited()
+        cache.set.assert_not_awaited()
+
+    async def test_markdown_only_report_skips_html(self):
+        """Test HTML is rendered only for formats that need it."""
+        from app.agents.report_generator import ReportGeneratorAgent
+
+        generator = ReportGeneratorAgent()
+        generator.formatting_tools.generate_html = AsyncMock(return_value="<p>r</p>")
+        cached = {"title": "Cached", "markdown_content": "r", "html_content": "", "quality_score": 3.0}
+        cache = Mock(get=AsyncMock(return_value=cached), set=AsyncMock())
+        context = {"query": "q", "validated_findings": [{"content": "f"}]}
+
+        with patch("app.agents.report_generator.get_redis", return_value=cache):
+            markdown_only = await generator.execute(dict(context, report_format="markdown"))
+            assert markdown_only["report"]["html_content"] == ""
+            generator.formatting_tools.generate_html.assert_not_awaited()
+
+            html = await generator.execute(dict(context, report_format="html"))
+
+        assert html["report"]["html_content"] == "<p>r</p>"
+        generator.formatting_tools.generate_html.assert_awaited_once()
+
+    async def test_thin_report_skips_summary_llm_call(self):
+        """Test a report with almost no section text gets a template summary."""
+        from app.agents.report_generator import ReportGeneratorAgent
+
+        generator = ReportGeneratorAgent()
+        generator.formatting_tools.create_summary = AsyncMock()
+        sections = [{"title": "Research Methodology", "content": "m"},
+                    {"title": "Conclusions", "content": "c"}]
+
+        summary = await generator._generate_executive_summary(
+            "solar power", sections, {"confidence_level": "low"}
+        )
+
+        assert "solar power" in summary and "LOW" in summary
+        generator.formatting_tools.create_summary.assert_not_awaited()
+
+    async def test_score_batch_matches_scalar_score(self):
+        """Test vectorized quality scores agree with the per-report score."""
+        from app.agents.report_generator import ReportGeneratorAgent, score_batch
+
+        generator = ReportGeneratorAgent()
+        cases = [(0, 0, 0.0, 0.5), (50, 10, 5, 0.8), (250, 4, 4, 1.0)]
+
+        batch = score_batch(
+            [n for n, _, _, _ in cases],
+            [v / max(f, 1) for _, f, v, _ in cases],
+            [c for _, _, _, c in cases],
+        )
+
+        for (n, f, v, c), score in zip(cases, batch):
+            expected = generator._calculate_quality_score(
+                [{}] * f, [{}] * n,
+                {"verified_findings": v, "overall_confidence": c}
+            )
+            assert float(score) == expected
+
+    async def test_sections_are_written_concurrently_in_order(self):
+        """Test section writing overlaps LLM calls but keeps section order."""
+        from app.agents.report_generator import ReportGeneratorAgent
+
+        generator = ReportGeneratorAgent()
+
+        async def write(title, query, findings, sources, **kwargs):
+            await asyncio.sleep(0.05 if title == "First" else 0)
+            return f"{title} body"
+
+        generator._write_sections_batched = AsyncMock(return_value={})
+        sections = [{"title": "First"}, {"title": "Second"}]
+        with patch.object(generator, "_write_section_content", side_effect=write):
+            start = asyncio.get_running_loop().time()
+            written = await generator._write_sections("q", sections, [], [])
+            elapsed = asyncio.get_running_loop().time() - start
+
+        assert [s["content"] for s in written] == ["First body", "Second body"]
+        assert elapsed < 0.1
+
+    async def test_section_llm_calls_are_bounded(self):
+        """Test concurrent section LLM calls never exceed the semaphore limit."""
+        from app.agents.report_generator import ReportGeneratorAgent
+
+        generator = ReportGeneratorAgent()
+        generator._llm_sem = asyncio.Semaphore(2)
+        active = peak = 0
+
+        async def think(prompt, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return "body"
+
+        generator._write_sections_batched = AsyncMock(return_value={})
+        sections = [{"title": f"Section {i}"} for i in range(6)]
+        with patch.object(generator, "think", side_effect=think):
+            written = await generator._write_sections("q", sections, [], [])
+
+        assert len(written) == 6
+        assert peak == 2
+
+    async def test_batched_sections_skip_per_section_calls(self):
+        """Test one JSON response fills sections; missing ones are written individually."""
+        from app.agents.report_generator import ReportGeneratorAgent
+
+        generator = ReportGeneratorAgent()
+        generator.think = AsyncMock(return_value='{"Overview": "Batched overview"}')
+        generator._write_section_content = AsyncMock(return_value="Single call")
+
+        cache = Mock(get=AsyncMock(return_value=None), set=AsyncMock())
+        sections = [{"title": "Overview"}, {"title": "Outlook"}]
+        with patch("app.utils.llm_cache.get_redis", return_value=cache):
+            written = await generator._write_sections("q", sections, [], [])
+
+        assert [s["content"] for s in written] == ["Batched overview", "Single call"]
+        generator.think.assert_awaited_once()
+        generator._write_section_content.assert_awaited_once()
+
+    def test_section_context_findings_fit_budget(self):
+        """Test findings are clipped on word boundaries and capped in total."""
+        from app.agents.report_generator import ReportGeneratorAgent, _FINDINGS_BUDGET
+
+        generator = ReportGeneratorAgent()
+        findings = [{"title": f"T{i}", "content": "word " * 200} for i in range(25)]
+        context = generator._section_context("q", findings)
+        block = context.split("Available Findings:\n", 1)[1].split("\n\n", 1)[0]
+
+        assert len(block) <= _FINDINGS_BUDGET
+        assert all(line.endswith("word") for line in block.splitlines())
+
+    async def test_cached_think_skips_llm_on_hit(self):
+        """Test an identical prompt is answered from the response cache."""
+        from app.agents.report_generator import ReportGeneratorAgent
+        from app.utils.llm_cache import cached_think
+
+        generator = ReportGeneratorAgent()
+        generator.think = AsyncMock()
+        cache = Mock()
+        cache.get = AsyncMock(return_value="cached title")
+
+        with patch("app.utils.llm_cache.get_redis", return_value=cache):
+            result = await cached_think(generator, "prompt")
+
+        assert result == "cached title"
+        generator.think.assert_not_awaited()
+
+    async def test_title_memoized_in_process(self):
+        """Test a repeated query reuses its title without touching Redis."""
+        from app.agents import report_generator
+        from app.agents.report_generator import ReportGeneratorAgent
+
+        generator = ReportGeneratorAgent()
+        generator.think = AsyncMock(return_value="Solar Panel Efficiency Trends")
+        cache = Mock(get=AsyncMock(return_value=None), set=AsyncMock())
+
+        with patch.dict(report_generator._TITLE_CACHE, clear=True), \
+                patch("app.utils.llm_cache.get_redis", return_value=cache):
+            first = await generator._generate_title("solar panel efficiency")
+            second = await generator._generate_title("Solar panel efficiency?")
+
+        assert first == second == "Solar Panel Efficiency Trends"
+        generator.think.assert_awaited_once()
+        cache.get.assert_awaited_once()
+
+    async def test_cached_think_bypassed_for_high_temperature(self):
+        """Test agents sampling above the cacheable temperature skip the cache."""
+        from app.agents.report_generator import ReportGeneratorAgent
+        from app.utils.llm_cache import cached_think
+
+        generator = ReportGeneratorAgent()
+        generator.temperature = 0.9
+        generator.think = AsyncMock(return_value="fresh")
+        cache = Mock(get=AsyncMock(return_value="cached"))
+
+        with patch("app.utils.llm_cache.get_redis", return_value=cache):
+            result = await cached_think(generator, "prompt")
+
+        assert result == "fresh"
+        cache.get.assert_not_awaited()
+
+    async def test_reworded_queries_share_title_cache_key(self):
+        """Test query normalization ignores case, punctuation and stopwords but not word order."""
+        from app.utils.llm_cache import normalize_query
+
+        assert normalize_query("The impact of AI?") == normalize_query("impact of AI")
+        assert normalize_query("AI impact") != normalize_query("AI safety")
+        assert normalize_query("effect of X on Y") != normalize_query("effect of Y on X")
+        assert normalize_query("why did X fail") != normalize_query("how did X fail")
+
 
 class TestOrchestrator:
     """Test Agent Orchestrator."""
@@ -134,6 +496,197 @@ class TestOrchestrator:
         assert "agents" in status
         assert "overall_progress" in status
 
+    async def test_status_tracks_agent_progress(self):
+        """Test agent progress updates flow into the status snapshot."""
+        from app.agents.orchestrator import AgentOrchestrator
+        from app.agents.base_agent import AgentStatus
+
+        orchestrator = AgentOrchestrator()
+        await orchestrator.researcher._set_status(AgentStatus.IN_PROGRESS)
+        await orchestrator.researcher._update_progress(50, "Searching")
+
+        status = orchestrator.get_status()
+
+        assert status["agents"]["researcher"]["status"] == "in_progress"
+        assert status["agents"]["researcher"]["progress"] == 50
+        assert status["agents"]["researcher"]["output"] == "Searching"
+        assert status["agents"]["researcher"]["start_time"] is not None
+        assert status["overall_progress"] == 10
+
+    async def test_agents_are_reused_across_sessions(self):
+        """Test released agents return to the pool with session state cleared."""
+        from app.agents.orchestrator import AgentOrchestrator
+        from app.agents.base_agent import AgentStatus
+        
+        first = AgentOrchestrator()
+        researcher = first.researcher
+        researcher.status = AgentStatus.COMPLETED
+        researcher.sources_found = {"total": 12}
+        first.release_agents()
+        
+        second = AgentOrchestrator()
+        
+        assert second.researcher is researcher
+        assert second.researcher.status == AgentStatus.IDLE
+        assert second.researcher.sources_found == {}
+        second.release_agents()
+    
+    async def test_cancel_interrupts_running_agent(self):
+        """Test cancel() stops an in-flight agent instead of waiting for it."""
+        from app.agents.orchestrator import AgentOrchestrator
+        
+        orchestrator = AgentOrchestrator()
+        
+        async def never_finishes(context):
+            await asyncio.sleep(60)
+        
+        with patch.object(orchestrator.user_proxy, "execute", never_finishes):
+            task = asyncio.create_task(orchestrator.execute("session-1", "test query"))
+            await asyncio.sleep(0.01)
+            await orchestrator.cancel()
+            result = await asyncio.wait_for(task, timeout=1)
+        
+        assert result["status"] == "cancelled"
+        assert not task.cancelled()
+    
+    async def test_final_response_shares_result_payloads(self):
+        """Test the final response references agent payloads without copying."""
+        from app.agents.orchestrator import AgentOrchestrator
+        
+        orchestrator = AgentOrchestrator()
+        sources = [{"title": "Source", "url": "https://example.com"}]
+        findings = [{"content": "Finding"}]
+        orchestrator.results = {
+            "researcher": {"sources": sources},
+            "fact_checker": {"validated_findings": findings},
+        }
+        
+        response = orchestrator._build_final_response()
+        
+        assert response["sources"] is sources
+        assert response["findings"] is findings
+        orchestrator.release_agents()
+
+    async def test_final_response_encodes_datetimes(self):
+        """Test metadata timestamps serialize to ISO strings."""
+        import orjson
+        from app.agents.orchestrator import AgentOrchestrator
+
+        orchestrator = AgentOrchestrator()
+        orchestrator.started_at = datetime(2024, 1, 2, 3, 4, 5)
+
+        payload = orjson.loads(orjson.dumps(orchestrator._build_final_response()))
+
+        assert payload["metadata"]["started_at"] == "2024-01-02T03:04:05"
+        assert payload["metadata"]["completed_at"] is None
+    
+    async def test_execute_parallel_preserves_order(self):
+        """Test independent steps run concurrently and keep result order."""
+        from app.agents.orchestrator import AgentOrchestrator
+        
+        orchestrator = AgentOrchestrator()
+        
+        async def step(value, delay):
+            await asyncio.sleep(delay)
+            return value
+        
+        results = await orchestrator._execute_parallel(step("slow", 0.02), step("fast", 0))
+        
+        assert results == ["slow", "fast"]
+
+    async def test_agent_receives_only_required_context(self):
+        """Test each agent is handed just the context keys it declares."""
+        from app.agents.orchestrator import AgentOrchestrator
+
+        orchestrator = AgentOrchestrator()
+        orchestrator.analyst.execute = AsyncMock(return_value={"status": "completed"})
+        context = {
+            "query": "q",
+            "session_id": "s1",
+            "memory": None,
+            "search_hints": "hint",
+            "research_plan": {},
+        }
+
+        await orchestrator._execute_agent(orchestrator.analyst, context, "analyst")
+
+        orchestrator.analyst.execute.assert_awaited_once_with(
+            {"query": "q", "session_id": "s1", "memory": None}
+        )
+
+    async def test_cacheable_agent_reuses_cached_output(self):
+        """Test a cache hit skips running a cacheable agent."""
+        from app.agents.orchestrator import AgentOrchestrator
+
+        orchestrator = AgentOrchestrator()
+        orchestrator.researcher.execute = AsyncMock()
+        cache = Mock()
+        cache.get_agent_cache = AsyncMock(return_value={"status": "completed", "sources": []})
+
+        with patch("app.agents.orchestrator.get_redis", return_value=cache):
+            result = await orchestrator._execute_agent(
+                orchestrator.researcher, {"query": "q", "memory": None}, "researcher"
+            )
+
+        assert result == {"status": "completed", "sources": []}
+        cache.get_agent_cache.assert_awaited_once_with("researcher", {"query": "q"})
+        orchestrator.researcher.execute.assert_not_awaited()
+
+    async def test_progress_updates_are_coalesced(self):
+        """Test rapid progress updates collapse to the latest per agent."""
+        from app.agents.orchestrator import _ProgressCoalescer
+        
+        callback = AsyncMock()
+        coalescer = _ProgressCoalescer(callback)
+        
+        for progress in range(10):
+            await coalescer(agent_name="researcher", status="in_progress", progress=progress)
+        assert callback.await_count == 0
+        
+        await asyncio.sleep(coalescer.FLUSH_DELAY * 3)
+        
+        assert callback.await_count == 1
+        assert callback.await_args.kwargs["progress"] == 9
+        assert callback.await_args.kwargs["seq"] == 1
+    
+    async def test_terminal_progress_bypasses_debounce(self):
+        """Test completed/failed updates are sent without waiting for the debounce."""
+        from app.agents.orchestrator import _ProgressCoalescer
+        
+        callback = AsyncMock()
+        coalescer = _ProgressCoalescer(callback)
+        
+        await coalescer(agent_name="analyst", status="in_progress", progress=50)
+        await coalescer(agent_name="researcher", status="completed", progress=100)
+        await asyncio.sleep(coalescer.FLUSH_DELAY / 5)
+        
+        assert callback.await_count == 2
+        assert callback.await_args_list[0].kwargs["agent_name"] == "analyst"
+        assert callback.await_args_list[1].kwargs["status"] == "completed"
+    
+    async def test_slow_progress_consumer_does_not_block(self):
+        """Test a slow callback neither blocks producers nor grows the queue unbounded."""
+        from app.agents.orchestrator import _ProgressCoalescer
+        
+        release = asyncio.Event()
+        delivered = []
+        
+        async def slow_callback(**update):
+            await release.wait()
+            delivered.append(update)
+        
+        coalescer = _ProgressCoalescer(slow_callback)
+        for i in range(coalescer.MAX_QUEUED * 2):
+            await coalescer(agent_name=f"agent_{i % 3}", status="completed", progress=i)
+        
+        assert coalescer.dropped > 0
+        
+        release.set()
+        await coalescer.flush()
+        
+        assert len(delivered) <= coalescer.MAX_QUEUED + 1
+        assert delivered[-1]["progress"] == coalescer.MAX_QUEUED * 2 - 1
+
 
 class TestSearchTools:
     """Test search tools."""
@@ -211,6 +764,22 @@ class TestFormattingTools:
         
         assert len(citations) > 0
 
+    async def test_markdown_body_served_from_cache(self):
+        """Test a cached body skips rendering but keeps a fresh header."""
+        from app.tools.formatting_tools import FormattingTools
+
+        tools = FormattingTools()
+        cache = Mock(get=AsyncMock(return_value="## Cached body"), set=AsyncMock())
+
+        with patch("app.tools.formatting_tools.get_redis", return_value=cache), \
+                patch.object(tools, "format_citations") as format_citations:
+            md = await tools.generate_markdown("Title", [{"title": "A"}], [])
+
+        assert md.startswith("# Title")
+        assert md.endswith("## Cached body")
+        format_citations.assert_not_called()
+        cache.set.assert_not_awaited()
+
 
 class TestModels:
     """Test Pydantic models."""
@@ -282,6 +851,43 @@ class TestWebSocket:
         count = manager.get_connection_count("test-session")
         
         assert count == 0
+    
+    async def test_replay_updates_since_sequence(self):
+        """Test buffered updates newer than the client's last seq are replayed."""
+        from app.api.websocket import ConnectionManager
+        
+        manager = ConnectionManager()
+        for seq in range(1, 6):
+            manager.record_update("test-session", {"type": "agent_status_update", "seq": seq})
+        
+        missed = manager.get_updates_since("test-session", 3)
+        
+        assert [m["seq"] for m in missed] == [4, 5]
+        
+        manager.clear_updates("test-session")
+        assert manager.get_updates_since("test-session", 0) == []
+
+    async def test_resume_replays_only_to_requesting_socket(self):
+        """Test a resume request replays missed updates to its own socket only."""
+        from app.api.websocket import ConnectionManager, handle_client_message
+
+        manager = ConnectionManager()
+        resuming, other = Mock(send_json=AsyncMock()), Mock(send_json=AsyncMock())
+        manager.active_connections["test-session"] = [resuming, other]
+        manager.record_update("test-session", {"type": "agent_status_update", "seq": 1})
+
+        with patch("app.api.websocket.manager", manager):
+            await handle_client_message("test-session", {"type": "resume", "last_seq": 0}, resuming)
+
+        resuming.send_json.assert_awaited_once_with({"type": "agent_status_update", "seq": 1})
+        other.send_json.assert_not_awaited()
+
+        # Malformed last_seq values fall back to a full replay
+        for bad in (None, "abc", "1.5"):
+            resuming.send_json.reset_mock()
+            with patch("app.api.websocket.manager", manager):
+                await handle_client_message("test-session", {"type": "resume", "last_seq": bad}, resuming)
+            resuming.send_json.assert_awaited_once()
 
 
 # Configuration for pytest